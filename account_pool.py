@@ -0,0 +1,196 @@
+"""
+Suno-Kontenpool für den KI Song-Agent
+Verteilt Aufträge auf mehrere API-Keys. Pro Key werden laufende Aufträge,
+die Fehlerquote der letzten Aufrufe und der Credit-Stand geführt. Jeder neue
+Auftrag geht an das Konto mit der geringsten Last; die Abfragen eines
+Auftrags laufen über den Key, der ihn angenommen hat. Leere Konten werden
+übergangen, bis ihr Credit-Stand wieder ausreicht.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Mapping
+
+from deadline import Deadline
+from suno_client import get_remaining_credits
+
+CREDIT_TTL    = 60                       # Sekunden, bis der Credit-Stand neu abgefragt wird
+LOW_CREDITS   = 10                       # darunter gilt ein Konto als leer (wie die Warnung in der Sidebar)
+ERROR_WINDOW  = 20                       # letzte Aufrufe für die Fehlerquote
+ERROR_PENALTY = 4                        # 100 % Fehler wiegen so viel wie vier laufende Aufträge
+
+
+def load_api_keys(secrets: Mapping) -> list[str]:
+    """Keys aus "suno_api_keys" (Liste oder kommagetrennt) und "suno_api_key", ohne Duplikate"""
+    keys = secrets.get("suno_api_keys") or []
+    if isinstance(keys, str):
+        keys = keys.split(",")
+    keys = [*keys, secrets.get("suno_api_key") or ""]
+    return list(dict.fromkeys(key.strip() for key in keys if key and key.strip()))
+
+
+class Account:
+    """Laufzeitdaten eines API-Keys"""
+    __slots__ = ("key", "in_flight", "results", "credits", "credits_at", "credits_error", "refreshing")
+
+    def __init__(self, key: str):
+        self.key = key
+        self.in_flight = 0
+        self.results: deque[bool] = deque(maxlen=ERROR_WINDOW)
+        self.credits: int | None = None
+        self.credits_at = 0.0
+        self.credits_error: str | None = None
+        self.refreshing = False          # eine Abfrage läuft; andere Aufrufer nehmen den bisherigen Stand
+
+    @property
+    def label(self) -> str:
+        return f"…{self.key[-4:]}"
+
+    @property
+    def error_rate(self) -> float:
+        return self.results.count(False) / len(self.results) if self.results else 0.0
+
+    @property
+    def usable(self) -> bool:
+        return self.credits is None or self.credits >= LOW_CREDITS
+
+
+class AccountPool:
+    """Wählt pro Auftrag das am wenigsten belastete Konto mit ausreichend Credits"""
+
+    def __init__(self, keys: Iterable[str], credits: Callable[..., dict] = get_remaining_credits,
+                 credit_ttl: float = CREDIT_TTL):
+        self._accounts = {key: Account(key) for key in keys}
+        if not self._accounts:
+            raise ValueError("Mindestens ein Suno API-Key wird benötigt")
+        self._fetch_credits = credits
+        self._credit_ttl = credit_ttl
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._accounts)
+
+    def acquire(self, exclude: Iterable[str] = (), deadline: Deadline | None = None) -> str:
+        """Reserviert das beste Konto für einen neuen Auftrag; ohne verfügbares Konto RuntimeError"""
+        self._refresh_stale(deadline)    # veraltete Stände auffrischen, bevor gewählt wird
+        exclude = set(exclude)
+        with self._lock:
+            candidates = [a for a in self._accounts.values() if a.usable and a.key not in exclude]
+            if not candidates:
+                raise RuntimeError("Kein Suno-Konto mit ausreichend Credits verfügbar")
+            best = min(candidates, key=lambda a: (a.in_flight + ERROR_PENALTY * a.error_rate,
+                                                  -(a.credits or 0)))
+            best.in_flight += 1
+            return best.key
+
+    def release(self, key: str) -> None:
+        """Gibt die Reservierung eines Auftrags frei (fertig, fehlgeschlagen oder verworfen)"""
+        with self._lock:
+            account = self._accounts.get(key)
+            if account is not None and account.in_flight:
+                account.in_flight -= 1
+
+    def in_flight(self, key: str) -> int:
+        """Anzahl der Aufträge, die das Konto gerade belegen"""
+        with self._lock:
+            return self._accounts[key].in_flight
+
+    def record(self, key: str, ok: bool) -> None:
+        """Vermerkt Erfolg oder Fehler eines API-Aufrufs für die Fehlerquote"""
+        with self._lock:
+            account = self._accounts.get(key)
+            if account is not None:
+                account.results.append(ok)
+
+    def mark_exhausted(self, key: str) -> None:
+        """Suno meldet zu wenig Credits; das Konto wird bis zur nächsten Abfrage übergangen"""
+        with self._lock:
+            account = self._accounts.get(key)
+            if account is not None:
+                account.credits, account.credits_at = 0, time.time()
+
+    def credits(self, key: str, refresh: bool = False, deadline: Deadline | None = None) -> int | None:
+        """Credit-Stand eines Kontos, höchstens credit_ttl Sekunden alt; None, wenn unbekannt
+
+        Die Abfrage endet spätestens mit deadline; ist Suno gestört, bleibt der Stand unbekannt.
+        Läuft für das Konto schon eine Abfrage, gilt der bisherige Stand; mit refresh ist er dann
+        unbekannt, da die laufende Abfrage älter sein kann als der Anlass für refresh.
+        """
+        account = self._accounts[key]
+        with self._lock:
+            due = refresh or time.time() - account.credits_at > self._credit_ttl
+            claimed = due and not account.refreshing
+            if claimed:
+                account.refreshing = True
+        if claimed:
+            self._refresh(account, deadline)
+        elif due and refresh:
+            return None
+        return self._balance(account)
+
+    @staticmethod
+    def _balance(account: Account) -> int | None:
+        return account.credits if account.credits_error is None else None
+
+    def _refresh(self, account: Account, deadline: Deadline | None) -> None:
+        # Nur für Konten, deren refreshing der Aufrufer unter der Sperre gesetzt hat
+        try:
+            result = self._fetch_credits(account.key, deadline=deadline)
+            with self._lock:
+                if result.get("success"):
+                    account.credits, account.credits_error = result.get("credits"), None
+                else:
+                    account.credits_error = result.get("error")
+                account.credits_at = time.time()
+        finally:
+            account.refreshing = False
+
+    def _refresh_stale(self, deadline: Deadline | None = None) -> None:
+        """Fragt alle veralteten Stände parallel ab, jedes Konto nur einmal gleichzeitig
+
+        So wartet ein Auftrag höchstens eine Abfrage lang statt einer pro Konto.
+        """
+        now = time.time()
+        with self._lock:
+            stale = [a for a in self._accounts.values()
+                     if not a.refreshing and now - a.credits_at > self._credit_ttl]
+            for account in stale:
+                account.refreshing = True
+        if len(stale) == 1:
+            self._refresh(stale[0], deadline)
+        elif stale:
+            with ThreadPoolExecutor(max_workers=len(stale)) as executor:
+                list(executor.map(lambda account: self._refresh(account, deadline), stale))
+
+    def credit_summary(self, refresh: bool = False) -> dict:
+        """Summe aller Konten im Format von get_remaining_credits"""
+        if refresh:
+            with self._lock:
+                for account in self._accounts.values():
+                    account.credits_at = 0.0
+        self._refresh_stale()
+        # Nur die Stände lesen: eine noch laufende Abfrage eines anderen Aufrufers nicht wiederholen
+        with self._lock:
+            balances = [self._balance(account) for account in self._accounts.values()]
+        known = [credits for credits in balances if credits is not None]
+        if not known:
+            errors = [a.credits_error for a in self._accounts.values() if a.credits_error]
+            return {"success": False, "error": errors[0] if errors else "Unbekannter Fehler"}
+        return {"success": True, "credits": sum(known), "accounts": len(self._accounts),
+                "total_credits": None, "used_credits": None}
+
+    def snapshot(self) -> list[dict]:
+        """Kennzahlen pro Konto für die Anzeige"""
+        with self._lock:
+            return [
+                {"label": a.label, "in_flight": a.in_flight, "error_rate": a.error_rate,
+                 "credits": a.credits, "usable": a.usable}
+                for a in self._accounts.values()
+            ]
+
+
+def ensure_pool(accounts: "AccountPool | str") -> AccountPool:
+    """Erlaubt weiterhin einzelne Keys überall dort, wo ein Pool erwartet wird"""
+    return accounts if isinstance(accounts, AccountPool) else AccountPool([accounts])
@@ -0,0 +1,214 @@
+"""
+Zulassungssteuerung für den KI Song-Agent
+Begrenzt, wie viele Aufträge gleichzeitig bei Ollama und Suno laufen. Wer
+warten muss, reiht sich pro Nutzer (Session) ein; freie Plätze werden reihum
+über die Nutzer vergeben, sodass ein Fan-out mit vielen Genres die
+Einzelsongs anderer nicht aushungert. Für jeden Wartenden lassen sich
+Position und voraussichtliche Wartezeit abfragen. Nachrangige Arbeit wie
+spekulative Lyrics bekommt nur freie Plätze, um die niemand wartet. Reichen
+die Credits nicht für alle offenen Songs, werden neue Aufträge gleich
+abgelehnt.
+"""
+
+import heapq
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Callable
+
+from deadline import Deadline, DeadlineExceeded
+
+UPSTREAM_SLOTS   = {"ollama": 2, "suno": 4}     # gleichzeitige Aufträge pro Dienst
+HOLD_ESTIMATES   = {"ollama": 30.0, "suno": 200.0}   # Startwerte der Belegdauer in Sekunden
+CREDITS_PER_SONG = 12                    # Richtwert pro Suno-Auftrag (zwei Clips)
+HOLD_SMOOTHING   = 0.2                   # Gewicht neuer Messungen im gleitenden Mittel
+
+
+class AdmissionRefused(RuntimeError):
+    """Die Credits reichen nicht für die bereits wartenden und laufenden Songs"""
+
+
+class Ticket:
+    """Platz eines Auftrags in der Warteschlange eines Dienstes"""
+    __slots__ = ("upstream", "owner", "songs", "enqueued_at", "admitted_at", "released", "_admitted")
+
+    def __init__(self, upstream: str, owner: str, songs: int):
+        self.upstream = upstream
+        self.owner = owner
+        self.songs = songs               # Suno-Aufträge, die an diesem Ticket hängen
+        self.enqueued_at = time.time()
+        self.admitted_at: float | None = None
+        self.released = False
+        self._admitted = threading.Event()
+
+    @property
+    def admitted(self) -> bool:
+        return self._admitted.is_set()
+
+
+class _Lane:
+    """Laufende und wartende Tickets eines Dienstes"""
+
+    def __init__(self, capacity: int, hold: float):
+        self.capacity = capacity
+        self.hold = hold                 # gleitendes Mittel der Belegdauer
+        self.active: list[Ticket] = []
+        self.waiting: OrderedDict[str, deque[Ticket]] = OrderedDict()   # Reihenfolge = nächster Nutzer
+
+    def order(self):
+        """Wartende Tickets in der Reihenfolge, in der sie zugelassen würden (reihum pro Nutzer)"""
+        queues = [deque(queue) for queue in self.waiting.values()]
+        while queues:
+            queue = queues.pop(0)
+            yield queue.popleft()
+            if queue:
+                queues.append(queue)
+
+
+class AdmissionController:
+    """Globale Obergrenze pro Dienst mit fairer Warteschlange über alle Nutzer"""
+
+    def __init__(self, capacity: dict[str, int] | None = None,
+                 hold_estimates: dict[str, float] | None = None,
+                 credits: Callable[[], int | None] | None = None,
+                 credits_per_song: int = CREDITS_PER_SONG):
+        capacity = capacity or UPSTREAM_SLOTS
+        hold_estimates = {**HOLD_ESTIMATES, **(hold_estimates or {})}
+        self._lanes = {name: _Lane(slots, hold_estimates.get(name, 60.0)) for name, slots in capacity.items()}
+        self._credits = credits
+        self._credits_per_song = credits_per_song
+        self._lock = threading.Lock()
+
+    def check_budget(self, songs: int = 1) -> None:
+        """Lehnt ab, wenn die Credits nicht für alle offenen und die neuen Songs reichen"""
+        if self._credits is None:
+            return
+        credits = self._credits()
+        if credits is None:
+            return
+        with self._lock:
+            pending = sum(
+                ticket.songs
+                for lane in self._lanes.values()
+                for ticket in [*lane.active, *(t for queue in lane.waiting.values() for t in queue)]
+            )
+        needed = (pending + songs) * self._credits_per_song
+        if credits < needed:
+            raise AdmissionRefused(
+                f"Nicht genug Credits: {credits} verfügbar, {needed} für {pending} offene und {songs} neue Songs nötig"
+            )
+
+    def enqueue(self, upstream: str, owner: str, songs: int = 1) -> Ticket:
+        """Reiht einen Auftrag ein; ist ein Platz frei, wird er sofort zugelassen"""
+        ticket = Ticket(upstream, owner, songs)
+        with self._lock:
+            lane = self._lanes[upstream]
+            lane.waiting.setdefault(owner, deque()).append(ticket)
+            self._dispatch(lane)
+        return ticket
+
+    def try_enqueue(self, upstream: str, owner: str, songs: int = 0) -> Ticket | None:
+        """Nachrangige Aufträge: sofort zugelassen, wenn ein Platz frei ist und niemand wartet, sonst None"""
+        with self._lock:
+            lane = self._lanes[upstream]
+            if lane.waiting or len(lane.active) >= lane.capacity:
+                return None
+            ticket = Ticket(upstream, owner, songs)
+            lane.waiting.setdefault(owner, deque()).append(ticket)
+            self._dispatch(lane)
+        return ticket
+
+    def wait(self, ticket: Ticket, timeout: float | None = None) -> bool:
+        """Wartet auf die Zulassung; False, wenn die Zeit vorher abläuft"""
+        return ticket._admitted.wait(timeout)
+
+    def release(self, ticket: Ticket) -> None:
+        """Gibt den Platz frei oder nimmt ein wartendes Ticket aus der Schlange"""
+        with self._lock:
+            if ticket.released:
+                return
+            ticket.released = True
+            lane = self._lanes[ticket.upstream]
+            if ticket.admitted:
+                lane.active.remove(ticket)
+                # Nachrangige Tickets (songs=0) werden oft abgebrochen und zählen nicht zur Belegdauer
+                if ticket.songs:
+                    duration = time.time() - ticket.admitted_at
+                    lane.hold += HOLD_SMOOTHING * (duration - lane.hold)
+            else:
+                queue = lane.waiting.get(ticket.owner)
+                if queue is not None and ticket in queue:
+                    queue.remove(ticket)
+                    if not queue:
+                        del lane.waiting[ticket.owner]
+            self._dispatch(lane)
+
+    def position(self, ticket: Ticket) -> tuple[int, float] | None:
+        """(Wartende davor, geschätzte Sekunden bis zur Zulassung) oder None, wenn schon zugelassen"""
+        with self._lock:
+            if ticket.admitted or ticket.released:
+                return None
+            lane = self._lanes[ticket.upstream]
+            ahead = 0
+            for queued in lane.order():
+                if queued is ticket:
+                    break
+                ahead += 1
+            # Freiwerdende Plätze durchspielen: jeder frühere Platz wird nach der mittleren Belegdauer wieder frei
+            now = time.time()
+            slots = [max(lane.hold - (now - t.admitted_at), 0.0) for t in lane.active]
+            slots += [0.0] * (lane.capacity - len(slots))
+            heapq.heapify(slots)
+            for _ in range(ahead):
+                heapq.heappush(slots, heapq.heappop(slots) + lane.hold)
+            return ahead, slots[0]
+
+    @contextmanager
+    def slot(self, upstream: str, owner: str, songs: int = 1,
+             on_wait: Callable[[int, float], None] | None = None,
+             deadline: Deadline | None = None):
+        """Hält einen Platz für die Dauer des Blocks; on_wait erhält währenddessen Position und ETA
+
+        Läuft die Frist ab, bevor ein Platz frei wird, verlässt der Auftrag die Schlange (DeadlineExceeded).
+        """
+        ticket = self.enqueue(upstream, owner, songs)
+        try:
+            while not self.wait(ticket, timeout=1):
+                if deadline is not None and deadline.expired:
+                    raise DeadlineExceeded(f"Frist abgelaufen in der Warteschlange: {upstream}")
+                position = self.position(ticket)
+                if position is not None and on_wait is not None:
+                    on_wait(*position)
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    def snapshot(self) -> dict[str, dict]:
+        """Belegung pro Dienst für die Anzeige"""
+        with self._lock:
+            return {
+                name: {"capacity": lane.capacity, "active": len(lane.active),
+                       "waiting": sum(len(queue) for queue in lane.waiting.values()),
+                       "hold": lane.hold}
+                for name, lane in self._lanes.items()
+            }
+
+    def _dispatch(self, lane: _Lane) -> None:
+        while len(lane.active) < lane.capacity and lane.waiting:
+            owner, queue = next(iter(lane.waiting.items()))
+            ticket = queue.popleft()
+            if queue:
+                lane.waiting.move_to_end(owner)
+            else:
+                del lane.waiting[owner]
+            ticket.admitted_at = time.time()
+            lane.active.append(ticket)
+            ticket._admitted.set()
+
+
+@lru_cache(maxsize=1)
+def default_admission() -> AdmissionController:
+    """Prozessweite Zulassung ohne Credit-Prüfung, für Code außerhalb von Streamlit"""
+    return AdmissionController()
@@ -0,0 +1,103 @@
+"""
+MP3-Zwischenspeicher für den KI Song-Agent
+Fertige Songs werden einmal im Hintergrund heruntergeladen und als Datei
+abgelegt. Download-Buttons lesen erst beim Klick daraus, statt die Bytes
+schon beim Anzeigen des Ergebnisses zu laden und mehrfach im Speicher zu halten.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+from suno_client import download_audio
+
+AUDIO_DIR       = os.path.join(tempfile.gettempdir(), "song_agent_audio")
+MAX_AUDIO_FILES = 50                     # ältere Dateien werden verworfen
+
+
+class _Fetch:
+    __slots__ = ("path", "done", "error")
+
+    def __init__(self, path: str):
+        self.path = path
+        self.done = threading.Event()
+        self.error: Exception | None = None
+
+
+class AudioStore:
+    """Lädt jede Audio-URL höchstens einmal und hält sie als Datei vor"""
+
+    def __init__(self, directory: str = AUDIO_DIR, max_files: int = MAX_AUDIO_FILES,
+                 fetch: Callable[[str], bytes] = download_audio):
+        self._directory = directory
+        self._max_files = max_files
+        self._fetch = fetch
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _Fetch] = OrderedDict()
+
+    def prefetch(self, url: str) -> None:
+        """Startet den Download im Hintergrund, sofern die URL noch nicht geladen wurde"""
+        self._entry(url)
+
+    def _entry(self, url: str) -> _Fetch:
+        """Vorhandener oder neu gestarteter Download für url, unter der Sperre ermittelt"""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None and entry.error is None:
+                self._entries.move_to_end(url)
+                return entry
+            name = hashlib.sha1(url.encode("utf-8")).hexdigest()
+            entry = self._entries[url] = _Fetch(os.path.join(self._directory, f"{name}.mp3"))
+            self._evict()
+        threading.Thread(target=self._run, args=(url, entry), daemon=True).start()
+        return entry
+
+    def status(self, url: str) -> str | None:
+        """"loading", "ready", "failed" oder None, wenn die URL unbekannt ist"""
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+        if not entry.done.is_set():
+            return "loading"
+        return "failed" if entry.error else "ready"
+
+    def read(self, url: str, timeout: float | None = None) -> bytes:
+        """Wartet auf den Download und liefert die Bytes; Fehler als RuntimeError"""
+        for _ in range(2):
+            entry = self._entry(url)
+            if not entry.done.wait(timeout):
+                raise RuntimeError("Download dauert zu lange")
+            if entry.error:
+                raise RuntimeError(str(entry.error))
+            # Unter der Sperre kann die Verdrängung die Datei nicht während des Lesens löschen
+            with self._lock:
+                if self._entries.get(url) is not entry:
+                    continue             # inzwischen verdrängt: einmal neu laden
+                try:
+                    with open(entry.path, 'rb') as f:
+                        return f.read()
+                except FileNotFoundError:
+                    del self._entries[url]   # von außen gelöscht: einmal neu laden
+        raise RuntimeError("Audiodatei nicht mehr verfügbar")
+
+    def _run(self, url: str, entry: _Fetch) -> None:
+        try:
+            data = self._fetch(url)
+            os.makedirs(self._directory, exist_ok=True)
+            tmp_path = f"{entry.path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, entry.path)
+        except Exception as e:
+            entry.error = e
+        finally:
+            entry.done.set()
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._max_files:
+            _, entry = self._entries.popitem(last=False)
+            if entry.done.is_set() and os.path.exists(entry.path):
+                os.remove(entry.path)
@@ -0,0 +1,204 @@
+"""
+Headless Batch-Kommandozeile für den KI Song-Agent
+Liest Song-Aufträge aus CSV/JSONL und führt Lyrics → Suno → Download ohne
+Streamlit aus. Fortschritt und Fehler werden als JSON-Zeilen auf stdout
+ausgegeben, MP3s, Lyrics und ein Ergebnis-Manifest landen im Ausgabeordner.
+
+Aufruf: python main.py batch songs.csv --out output/
+Spalten: description, genre, instrumental (optional: id, custom_style, profile)
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import threading
+import time
+
+import toml
+
+from account_pool import AccountPool, load_api_keys
+from batch_pipeline import BatchPipeline, make_job
+from deadline import JOB_DEADLINE
+from genre_catalog import default_catalog
+from lyrics_generator import build_lyrics_document
+from profiles import DEFAULT_PROFILE, PROFILES
+from suno_client import track_audio_url
+
+SECRETS_FILE = os.path.join(".streamlit", "secrets.toml")
+TRUE_VALUES  = ("1", "true", "yes", "y", "ja", "x")
+
+_print_lock = threading.Lock()
+
+def emit(event: str, **fields) -> None:
+    """Schreibt ein Ereignis als JSON-Zeile auf stdout"""
+    line = json.dumps({"event": event, "ts": round(time.time(), 3), **fields}, ensure_ascii=False)
+    with _print_lock:
+        print(line, flush=True)
+
+def resolve_api_keys(cli_keys: list[str] | None) -> list[str]:
+    """API-Keys aus Argumenten, Umgebungsvariable SUNO_API_KEY (kommagetrennt) oder secrets.toml"""
+    if cli_keys:
+        return load_api_keys({"suno_api_keys": cli_keys})
+    if os.environ.get("SUNO_API_KEY"):
+        return load_api_keys({"suno_api_keys": os.environ["SUNO_API_KEY"]})
+    try:
+        with open(SECRETS_FILE, 'r', encoding='utf-8') as f:
+            return load_api_keys(toml.load(f))
+    except (OSError, toml.TomlDecodeError):
+        return []
+
+def read_rows(path: str):
+    """Liest Aufträge zeilenweise aus einer CSV- oder JSONL-Datei"""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.lower().endswith((".jsonl", ".ndjson")):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(f)
+
+def row_id(row: dict, index: int) -> str:
+    """ID einer Eingabezeile; nur eine fehlende oder leere Spalte id fällt auf die Zeilennummer zurück"""
+    value = row.get("id")
+    return str(index if value in (None, "") else value)
+
+def parse_flag(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value or "").strip().lower() in TRUE_VALUES
+
+def slugify(text: str) -> str:
+    return "".join(c if c.isalnum() else "_" for c in text.lower()).strip("_")
+
+def iter_jobs(rows, lang: str, invalid: list, profile: str = DEFAULT_PROFILE):
+    """Wandelt Eingabezeilen in Pipeline-Jobs um; ungültige Zeilen landen in invalid
+
+    profile gilt für alle Zeilen ohne eigene Spalte "profile".
+    """
+    catalog = default_catalog()
+    for index, row in enumerate(rows, start=1):
+        job_id = row_id(row, index)
+        description = (row.get("description") or "").strip()
+        genre = (row.get("genre") or "").strip()
+        custom_style = (row.get("custom_style") or "").strip()
+        row_profile = (row.get("profile") or "").strip() or profile
+        error = None
+        if not description:
+            error = "description fehlt"
+        elif genre not in catalog:
+            error = f"Unbekanntes Genre: {genre!r}"
+        elif genre == "Custom" and not custom_style:
+            error = "custom_style fehlt für Genre Custom"
+        elif row_profile not in PROFILES:
+            error = f"Unbekanntes Profil: {row_profile!r}"
+        if error:
+            invalid.append({"id": job_id, "genre": genre, "song_description": description,
+                            "status": "failed", "error": error})
+            emit("failed", id=job_id, genre=genre, error=error)
+            continue
+        yield make_job(
+            job_id, description, genre,
+            catalog.style_description(genre, custom_style, lang),
+            instrumental=parse_flag(row.get("instrumental")),
+            genre_info=catalog.prompt_context(genre),
+            profile=PROFILES[row_profile]
+        )
+
+def make_audio_writer(out_dir: str):
+    """Schreibt die MP3s aller Varianten (<id>_<genre>_1.mp3, _2.mp3, ...) und die Lyrics-Datei direkt auf die Platte"""
+    def save_audio(job: dict, data: list[bytes]) -> None:
+        base = os.path.join(out_dir, f"{slugify(job['id'])}_{slugify(job['genre'])}")
+        mp3_paths = []
+        for index, clip in enumerate(data, start=1):
+            with open(f"{base}_{index}.mp3", 'wb') as f:
+                f.write(clip)
+            mp3_paths.append(f"{base}_{index}.mp3")
+        with open(f"{base}_lyrics.txt", 'w', encoding='utf-8') as f:
+            f.write(build_lyrics_document(job["tracks"][0], job["genre"], job["style"], job["lyrics"]))
+        job["mp3_paths"] = mp3_paths
+        job["lyrics_path"] = f"{base}_lyrics.txt"
+    return save_audio
+
+def on_event(event: str, job: dict) -> None:
+    fields = {"id": job["id"], "genre": job["genre"]}
+    if event == "submitted":
+        fields["task_id"] = job["task_id"]
+    elif event == "failed":
+        fields["error"] = job["error"]
+    elif event == "done":
+        fields["mp3"] = job.get("mp3_paths")
+    emit(event, **fields)
+
+def manifest_entry(job: dict) -> dict:
+    track_info = job["tracks"][0] if job.get("tracks") else {}
+    return {
+        "id": job["id"],
+        "genre": job["genre"],
+        "description": job["song_description"],
+        "instrumental": job.get("instrumental", False),
+        "profile": job["profile"].name if job.get("profile") else None,
+        "status": job["status"],
+        "error": job.get("error"),
+        "task_id": job.get("task_id"),
+        "title": track_info.get("title"),
+        "duration": track_info.get("duration"),
+        "audio_url": track_audio_url(track_info) if track_info else None,
+        "audio_urls": [track_audio_url(track) for track in job.get("tracks") or []],
+        "mp3": job.get("mp3_paths"),
+        "lyrics": job.get("lyrics_path"),
+        "timings": job.get("timings", {})
+    }
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="main.py batch", description="Songs ohne Browser im Batch erzeugen")
+    parser.add_argument("input", help="CSV- oder JSONL-Datei mit description, genre, instrumental")
+    parser.add_argument("--out", default="output", help="Ausgabeordner (Standard: output)")
+    parser.add_argument("--lang", default="en", choices=("en", "de"), help="Sprache der Stilbeschreibung")
+    parser.add_argument("--api-key", action="append",
+                        help="Suno API-Key, mehrfach angebbar (sonst SUNO_API_KEY oder .streamlit/secrets.toml)")
+    parser.add_argument("--profile", default=DEFAULT_PROFILE, choices=tuple(PROFILES),
+                        help=f"Generierungsprofil für Zeilen ohne eigene Spalte profile (Standard: {DEFAULT_PROFILE})")
+    parser.add_argument("--lyrics-workers", type=int, default=1, help="parallele Ollama-Aufrufe")
+    parser.add_argument("--submit-workers", type=int, default=2, help="parallele Suno-Aufträge")
+    parser.add_argument("--max-rendering", type=int, default=4, help="gleichzeitig laufende Suno-Renders")
+    parser.add_argument("--download-workers", type=int, default=4, help="parallele Downloads")
+    parser.add_argument("--job-deadline", type=float, default=JOB_DEADLINE,
+                        help=f"Sekunden pro Song von den Lyrics bis zur MP3 (Standard: {JOB_DEADLINE})")
+    return parser
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    api_keys = resolve_api_keys(args.api_key)
+    if not api_keys:
+        emit("error", error="Kein Suno API-Key gefunden (--api-key, SUNO_API_KEY oder .streamlit/secrets.toml)")
+        return 2
+    os.makedirs(args.out, exist_ok=True)
+
+    pipeline = BatchPipeline(
+        AccountPool(api_keys),
+        lyrics_workers=args.lyrics_workers,
+        submit_workers=args.submit_workers,
+        max_rendering=args.max_rendering,
+        download_workers=args.download_workers,
+        job_deadline=args.job_deadline,
+        on_event=on_event,
+        save_audio=make_audio_writer(args.out)
+    )
+    started = time.time()
+    invalid: list[dict] = []
+    jobs = pipeline.run(iter_jobs(read_rows(args.input), args.lang, invalid, args.profile))
+
+    entries = [manifest_entry(job) for job in invalid + jobs]
+    manifest_path = os.path.join(args.out, "manifest.json")
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(entries, f, ensure_ascii=False, indent=2)
+
+    failed = sum(1 for entry in entries if entry["status"] != "done")
+    emit("finished", total=len(entries), done=len(entries) - failed, failed=failed,
+         elapsed=round(time.time() - started, 1), manifest=manifest_path)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
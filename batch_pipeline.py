@@ -0,0 +1,341 @@
+"""
+Gepipelinete Batch-Ausführung für den KI Song-Agent
+Lyrics → Suno-Auftrag → Abfrage → Download laufen als eigene Stufen mit
+begrenzter Parallelität. Während Song N bei Suno gerendert wird, entstehen
+bereits die Lyrics für Song N+1, Downloads laufen parallel zu neuen Aufträgen.
+Volle Warteschlangen bremsen die vorgelagerte Stufe (Backpressure).
+"""
+
+import queue
+import threading
+import time
+from typing import Callable, Iterable
+
+from lyrics_generator import generate_lyrics_with_ollama
+from suno_client import (
+    build_song_payload,
+    download_audio,
+    get_task_info,
+    is_generation_complete,
+    track_audio_url
+)
+from account_pool import AccountPool, ensure_pool
+from deadline import JOB_DEADLINE, Deadline, DeadlineExceeded
+from eta_model import EtaModel, default_eta_model, render_key
+from health import CircuitOpen
+from profiles import GenerationProfile, get_profile
+from submission_cache import SubmissionCache, default_submissions
+
+MAX_POLL_ERRORS = 5                      # Verbindungsfehler bis ein Render aufgibt
+
+_DONE = object()                         # Sentinel: keine weiteren Jobs für diese Stufe
+
+def make_job(job_id: str, song_description: str, genre: str, style: str,
+             instrumental: bool = False, genre_info: dict | None = None,
+             profile: GenerationProfile | None = None) -> dict:
+    """Erstellt den Zustand eines Batch-Jobs"""
+    return {
+        "id": job_id,
+        "song_description": song_description,
+        "genre": genre,
+        "style": style,
+        "instrumental": instrumental,
+        "genre_info": genre_info or {},
+        "profile": profile or get_profile(),
+        "status": "queued",              # queued, lyrics, submitting, rendering, downloading, done, failed
+        "lyrics": "",
+        "task_id": None,
+        "submission_key": None,
+        "api_key": None,
+        "tracks": [],
+        "audio": None,
+        "error": None,
+        "submitted_at": None,
+        "deadline": None,                # Deadline ab Beginn der Lyrics-Stufe
+        "shared": False,                 # an einen laufenden gleichen Auftrag angehängt
+        "next_poll_at": None,
+        "timings": {}
+    }
+
+
+class BatchPipeline:
+    """Führt viele Song-Jobs überlappend über alle Pipeline-Stufen aus"""
+
+    def __init__(self, accounts: AccountPool | str, lyrics_workers: int = 1, submit_workers: int = 2,
+                 max_rendering: int = 4, download_workers: int = 4, queue_size: int = 2,
+                 on_event: Callable[[str, dict], None] | None = None,
+                 save_audio: Callable[[dict, list[bytes]], None] | None = None,
+                 submissions: SubmissionCache | None = None, fresh: bool = False,
+                 job_deadline: float = JOB_DEADLINE, eta_model: EtaModel | None = None):
+        """
+        lyrics_workers/submit_workers/download_workers: Threads pro Stufe
+        max_rendering: gleichzeitig laufende Suno-Renders
+        queue_size: Puffer zwischen den Stufen, begrenzt den Vorlauf
+        on_event: wird bei jedem Stufenwechsel mit (event, job) aufgerufen
+        save_audio: übernimmt die MP3-Daten aller Varianten, sonst landen sie als Liste in job["audio"]
+        submissions: Auftragscache; gleiche Zeilen teilen sich einen Render
+        fresh: fertige Ergebnisse gleicher Aufträge nicht wiederverwenden
+        job_deadline: Sekunden pro Job von den Lyrics bis zum Download; danach wird er abgebrochen
+        eta_model: Laufzeitstatistik für den Abfragetakt, bekommt die gemessenen Dauern
+        """
+        self._accounts = ensure_pool(accounts)
+        self._lyrics_workers = lyrics_workers
+        self._submit_workers = submit_workers
+        self._download_workers = download_workers
+        self._render_slots = threading.BoundedSemaphore(max_rendering)
+        self._on_event = on_event or (lambda event, job: None)
+        self._save_audio = save_audio
+        self._submissions = submissions or default_submissions()
+        self._fresh = fresh
+        self._job_deadline = job_deadline
+        self._eta = eta_model or default_eta_model()
+        self._lyrics_q = queue.Queue(maxsize=queue_size)
+        self._submit_q = queue.Queue(maxsize=queue_size)
+        self._poll_q = queue.Queue()
+        self._download_q = queue.Queue(maxsize=queue_size)
+
+    def run(self, jobs: Iterable[dict]) -> list[dict]:
+        """Verarbeitet alle Jobs und blockiert bis zum Ende, liefert die Jobs zurück"""
+        results = []
+        stages = [
+            self._start_stage(self._lyrics_stage, self._lyrics_q, self._lyrics_workers, self._submit_q,
+                              self._submit_workers),
+            self._start_stage(self._submit_stage, self._submit_q, self._submit_workers, self._poll_q, 1),
+            [threading.Thread(target=self._poll_stage, daemon=True)],
+            self._start_stage(self._download_stage, self._download_q, self._download_workers),
+        ]
+        stages[2][0].start()
+
+        # Zuführung: blockiert, sobald die Lyrics-Stufe ausgelastet ist
+        for job in jobs:
+            results.append(job)
+            self._lyrics_q.put(job)
+        for _ in range(self._lyrics_workers):
+            self._lyrics_q.put(_DONE)
+
+        for threads in stages:
+            for thread in threads:
+                thread.join()
+        return results
+
+    def _emit(self, event: str, job: dict) -> None:
+        try:
+            self._on_event(event, job)
+        except Exception:
+            pass
+
+    def _fail(self, job: dict, error: str) -> None:
+        job["status"] = "failed"
+        job["error"] = error
+        self._emit("failed", job)
+
+    def _start_stage(self, worker: Callable[[dict], dict | None], in_q: queue.Queue, count: int,
+                     out_q: queue.Queue | None = None, next_workers: int = 0) -> list[threading.Thread]:
+        """Startet die Threads einer Stufe; nach dem letzten Job erhält die nächste Stufe ihre Sentinels"""
+        def loop():
+            while True:
+                job = in_q.get()
+                if job is _DONE:
+                    return
+                try:
+                    result = worker(job)
+                except Exception as e:
+                    # Ein unerwarteter Fehler beendet nur diesen Job, nicht den Worker der Stufe
+                    self._fail(job, str(e))
+                    continue
+                if result is not None and out_q is not None:
+                    out_q.put(result)
+
+        workers = [threading.Thread(target=loop, daemon=True) for _ in range(count)]
+        for thread in workers:
+            thread.start()
+        if out_q is None:
+            return workers
+
+        def close():
+            for thread in workers:
+                thread.join()
+            for _ in range(next_workers):
+                out_q.put(_DONE)
+        closer = threading.Thread(target=close, daemon=True)
+        closer.start()
+        return workers + [closer]
+
+    def _lyrics_stage(self, job: dict) -> dict | None:
+        job["status"] = "lyrics"
+        # Die Frist beginnt mit der ersten Stufe, Wartezeit in der Zuführung zählt nicht
+        job["deadline"] = Deadline(self._job_deadline)
+        self._emit("lyrics_started", job)
+        started = time.time()
+        try:
+            job["lyrics"], _ = generate_lyrics_with_ollama(
+                job["song_description"], job["genre"], job["style"], job["genre_info"],
+                deadline=job["deadline"], **job["profile"].lyrics_options()
+            )
+        except RuntimeError as e:
+            self._fail(job, str(e))
+            return None
+        job["timings"]["lyrics"] = time.time() - started
+        self._eta.record("lyrics", (job["profile"].ollama_model, job["profile"].candidates),
+                         job["timings"]["lyrics"])
+        if not job["lyrics"]:
+            self._fail(job, "Keine Songtexte generiert")
+            return None
+        self._emit("lyrics_done", job)
+        return job
+
+    def _submit_stage(self, job: dict) -> dict | None:
+        # Ein freier Render-Slot ist Voraussetzung, sonst staut sich die Lyrics-Stufe
+        if not self._render_slots.acquire(timeout=job["deadline"].remaining()):
+            self._fail(job, "Frist abgelaufen beim Warten auf einen Render-Slot")
+            return None
+        job["status"] = "submitting"
+        payload = build_song_payload(job["genre"], job["song_description"], job["lyrics"],
+                                     job["style"], job["instrumental"], model=job["profile"].suno_model)
+        try:
+            submission = self._submissions.submit(payload, self._accounts, fresh=self._fresh,
+                                                  deadline=job["deadline"])
+            if not submission.task_id:
+                raise RuntimeError("Task-ID fehlt in der Antwort")
+        except Exception as e:
+            self._render_slots.release()
+            self._fail(job, str(e))
+            return None
+        job["task_id"] = submission.task_id
+        job["submission_key"] = submission.key
+        job["api_key"] = submission.api_key
+        job["submitted_at"] = submission.submitted_at
+        job["shared"] = submission.shared
+        job["next_poll_at"] = self._next_poll_at(job)
+        job["status"] = "rendering"
+        self._emit("submitted", job)
+        if submission.tracks:
+            # Schon gerendert: direkt zum Download, ohne Render-Slot zu belegen
+            self._render_slots.release()
+            job["tracks"] = submission.tracks
+            job["timings"]["render"] = 0.0
+            job["status"] = "downloading"
+            self._emit("rendered", job)
+            self._download_q.put(job)
+            return None
+        return job
+
+    def _poll_stage(self) -> None:
+        """Fragt alle laufenden Renders gemeinsam ab und reicht fertige an den Download weiter"""
+        rendering: list[dict] = []
+        errors: dict[str, int] = {}
+        closed = False
+        try:
+            while not closed or rendering:
+                # Neue Aufträge übernehmen; blockieren nur, wenn sonst nichts zu tun ist
+                try:
+                    while not closed:
+                        job = self._poll_q.get(block=not rendering)
+                        if job is _DONE:
+                            closed = True
+                        else:
+                            rendering.append(job)
+                except queue.Empty:
+                    pass
+                if not rendering:
+                    continue
+
+                # Jeder Job wird im Takt seines Profils und seiner erwarteten Renderdauer abgefragt
+                now = time.time()
+                due = [job for job in rendering if job["next_poll_at"] <= now]
+                if not due:
+                    time.sleep(min(job["next_poll_at"] for job in rendering) - now)
+                    continue
+                for job in due:
+                    finished = self._poll_job(job, errors)
+                    job["next_poll_at"] = self._next_poll_at(job)
+                    if finished:
+                        rendering.remove(job)
+                        self._render_slots.release()
+                        if job["status"] != "failed":
+                            self._download_q.put(job)
+        except Exception as e:
+            # Ohne Abfragestufe käme kein Render mehr an; offene und noch eintreffende Jobs scheitern sichtbar
+            for job in rendering:
+                self._abort_render(job, str(e))
+            while not closed:
+                job = self._poll_q.get()
+                if job is _DONE:
+                    closed = True
+                else:
+                    self._abort_render(job, str(e))
+        finally:
+            # Die Download-Stufe muss in jedem Fall enden, sonst blockiert run()
+            for _ in range(self._download_workers):
+                self._download_q.put(_DONE)
+
+    def _abort_render(self, job: dict, error: str) -> None:
+        """Gibt Auftrag und Render-Slot eines laufenden Jobs frei und markiert ihn als fehlgeschlagen"""
+        self._submissions.discard(job["submission_key"], job["task_id"])
+        self._render_slots.release()
+        self._fail(job, error)
+
+    def _render_key(self, job: dict) -> tuple:
+        return render_key(job["profile"].suno_model, job["instrumental"], job["lyrics"])
+
+    def _next_poll_at(self, job: dict) -> float:
+        now = time.time()
+        estimate = self._eta.estimate("render", self._render_key(job))
+        return now + job["profile"].poll_interval(now - job["submitted_at"], estimate)
+
+    def _poll_job(self, job: dict, errors: dict[str, int]) -> bool:
+        try:
+            job["deadline"].check("Rendern")
+            finished, failed, tracks = is_generation_complete(
+                get_task_info(job["task_id"], job["api_key"], deadline=job["deadline"])
+            )
+        except DeadlineExceeded as e:
+            self._submissions.discard(job["submission_key"], job["task_id"])
+            self._fail(job, str(e))
+            return True
+        except CircuitOpen:
+            return False
+        except RuntimeError as e:
+            self._accounts.record(job["api_key"], ok=False)
+            errors[job["id"]] = errors.get(job["id"], 0) + 1
+            if errors[job["id"]] >= MAX_POLL_ERRORS:
+                self._submissions.discard(job["submission_key"], job["task_id"])
+                self._fail(job, str(e))
+                return True
+            return False
+        except Exception as e:
+            # Unerwartete Antwort: nur dieser Job scheitert, die übrigen Renders laufen weiter
+            self._submissions.discard(job["submission_key"], job["task_id"])
+            self._fail(job, str(e))
+            return True
+        self._accounts.record(job["api_key"], ok=True)
+        errors.pop(job["id"], None)
+        if failed or (finished and not tracks):
+            self._submissions.discard(job["submission_key"], job["task_id"])
+            self._fail(job, "Generierung fehlgeschlagen")
+            return True
+        if finished:
+            self._submissions.complete(job["submission_key"], job["task_id"], tracks)
+            job["tracks"] = tracks
+            job["timings"]["render"] = time.time() - job["submitted_at"]
+            if not job["shared"]:
+                self._eta.record("render", self._render_key(job), job["timings"]["render"])
+            job["status"] = "downloading"
+            self._emit("rendered", job)
+        return finished
+
+    def _download_stage(self, job: dict) -> None:
+        started = time.time()
+        try:
+            # Suno liefert meist zwei Varianten; beide werden übernommen
+            data = [download_audio(track_audio_url(track), deadline=job["deadline"]) for track in job["tracks"]]
+            if self._save_audio is not None:
+                self._save_audio(job, data)
+            else:
+                job["audio"] = data
+        except (RuntimeError, OSError) as e:
+            self._fail(job, str(e))
+            return
+        job["timings"]["download"] = time.time() - started
+        job["status"] = "done"
+        self._emit("done", job)
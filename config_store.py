@@ -0,0 +1,88 @@
+"""
+Konfigurationsspeicher für den KI Song-Agent
+Hält die geparste config.toml prozessweit im Speicher und liest sie nur neu,
+wenn sich die Datei auf der Platte geändert hat. Änderungen werden unter
+einer Sperre auf dem aktuellen Stand zusammengeführt und atomar geschrieben,
+damit parallele Sessions sich nicht gegenseitig überschreiben.
+"""
+
+import copy
+import os
+import tempfile
+import threading
+
+import toml
+
+CONFIG_FILE    = "config.toml"
+DEFAULT_CONFIG = {"general": {"language": "de"}}
+
+
+class ConfigStore:
+    """Gecachte config.toml mit mtime-Prüfung und atomarem Schreiben"""
+
+    def __init__(self, path: str = CONFIG_FILE, defaults: dict | None = None):
+        self.path = path
+        self._defaults = defaults if defaults is not None else DEFAULT_CONFIG
+        self._lock = threading.RLock()
+        self._config: dict | None = None
+        self._stamp: tuple[int, int] | None = None   # (mtime_ns, Größe) der gecachten Fassung
+
+    def _file_stamp(self) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _refresh(self) -> dict:
+        stamp = self._file_stamp()
+        if self._config is not None and stamp == self._stamp:
+            return self._config
+        with self._lock:
+            stamp = self._file_stamp()
+            if self._config is None or stamp != self._stamp:
+                if stamp is None:
+                    # Standardkonfiguration anlegen, falls noch keine existiert
+                    self._write(copy.deepcopy(self._defaults))
+                else:
+                    with open(self.path, 'r', encoding='utf-8') as f:
+                        self._config = toml.load(f)
+                    self._stamp = stamp
+            return self._config
+
+    def _write(self, config: dict) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".config-", suffix=".toml", dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                toml.dump(config, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._config = config
+        self._stamp = self._file_stamp()
+
+    def load(self) -> dict:
+        """Kopie der aktuellen Konfiguration"""
+        return copy.deepcopy(self._refresh())
+
+    def get(self, section: str, key: str, default=None):
+        return self._refresh().get(section, {}).get(key, default)
+
+    def set(self, section: str, key: str, value) -> None:
+        """Setzt einen Wert und schreibt die Datei, sofern er sich geändert hat"""
+        with self._lock:
+            config = copy.deepcopy(self._refresh())
+            if config.get(section, {}).get(key) == value:
+                return
+            config.setdefault(section, {})[key] = value
+            self._write(config)
+
+    def save(self, config: dict) -> None:
+        """Ersetzt die komplette Konfiguration"""
+        with self._lock:
+            self._write(copy.deepcopy(config))
@@ -0,0 +1,47 @@
+"""
+Auftragsfristen für den KI Song-Agent
+Jeder Auftrag bekommt beim Start eine Frist für alle Stufen (Songtexte,
+Einreichen, Rendern, Download). Jede Stufe begrenzt ihre Timeouts, Wartezeiten
+und Wiederholungen auf die verbleibende Zeit; ist die Frist abgelaufen, wird
+die Arbeit abgebrochen statt fortgesetzt. So hält kein Auftrag Threads,
+Warteplätze oder Konten länger als JOB_DEADLINE.
+"""
+
+import time
+
+JOB_DEADLINE = 15 * 60                   # Sekunden für einen Song von den Songtexten bis zur MP3
+MIN_TIMEOUT  = 1                         # kürzere Timeouts lohnen keinen Versuch mehr
+
+
+class DeadlineExceeded(RuntimeError):
+    """Die Frist des Auftrags ist abgelaufen; die Stufe wurde abgebrochen"""
+
+
+class Deadline:
+    """Absoluter Zeitpunkt, bis zu dem ein Auftrag fertig sein muss"""
+    __slots__ = ("expires_at",)
+
+    def __init__(self, seconds: float = JOB_DEADLINE):
+        self.expires_at = time.time() + seconds
+
+    def remaining(self) -> float:
+        return max(self.expires_at - time.time(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return time.time() >= self.expires_at
+
+    def check(self, stage: str) -> None:
+        """Wirft DeadlineExceeded, wenn für die Stufe keine Zeit mehr bleibt"""
+        if self.remaining() < MIN_TIMEOUT:
+            raise DeadlineExceeded(f"Frist abgelaufen vor: {stage}")
+
+    def timeout(self, cap: float, stage: str) -> float:
+        """Timeout einer Stufe: höchstens cap, höchstens die verbleibende Zeit"""
+        self.check(stage)
+        return min(cap, self.remaining())
+
+
+def bounded(cap: float, deadline: Deadline | None, stage: str) -> float:
+    """Timeout für Aufrufer mit optionaler Frist"""
+    return cap if deadline is None else deadline.timeout(cap, stage)
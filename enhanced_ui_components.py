@@ -4,220 +4,150 @@ Verbesserte visuelle Elemente für den Anzeigeprozess
 """
 
 import streamlit as st
+import streamlit.components.v1 as components
+import json
 import time
-from typing import Dict, List
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
 
-def get_genre_colors(genre: str) -> Dict[str, str]:
-    """Gibt genre-spezifische Farbschemata zurück"""
-    color_schemes = {
-        "Deep House": {
-            "primary": "#1a1a2e",
-            "secondary": "#16213e", 
-            "accent": "#0f3460",
-            "highlight": "#533483"
-        },
-        "Synthpop": {
-            "primary": "#ff006e",
-            "secondary": "#8338ec",
-            "accent": "#3a86ff",
-            "highlight": "#06ffa5"
-        },
-        "Trap": {
-            "primary": "#2d2d2d",
-            "secondary": "#ff6b35",
-            "accent": "#f7931e",
-            "highlight": "#ffb627"
-        },
-        "Techno": {
-            "primary": "#000000",
-            "secondary": "#333333",
-            "accent": "#666666",
-            "highlight": "#00ff00"
-        },
-        "Ambient": {
-            "primary": "#e8f4f8",
-            "secondary": "#b8d4da",
-            "accent": "#88b4bc",
-            "highlight": "#5894a0"
-        },
-        "Drum & Bass": {
-            "primary": "#1a0033",
-            "secondary": "#330066",
-            "accent": "#4d0099",
-            "highlight": "#6600cc"
-        },
-        "Future Bass": {
-            "primary": "#ff0080",
-            "secondary": "#8000ff",
-            "accent": "#0080ff",
-            "highlight": "#00ffff"
-        },
-        "Lo-Fi Hip Hop": {
-            "primary": "#8b4513",
-            "secondary": "#cd853f",
-            "accent": "#daa520",
-            "highlight": "#ffd700"
-        },
-        "Psytrance": {
-            "primary": "#4b0082",
-            "secondary": "#8a2be2",
-            "accent": "#9932cc",
-            "highlight": "#da70d6"
-        },
-        "Indie Pop": {
-            "primary": "#ff69b4",
-            "secondary": "#ff1493",
-            "accent": "#dc143c",
-            "highlight": "#b22222"
-        },
-        "Hardstyle": {
-            "primary": "#ff0000",
-            "secondary": "#cc0000",
-            "accent": "#990000",
-            "highlight": "#ffff00"
-        }
+DEFAULT_GENRE = "Deep House"
+THEME_CACHE   = 64                       # zwischengespeicherte Genres pro Fragment
+_SLOT         = "\x00"                   # Platzhalter für dynamische Werte in gecachten Hüllen
+LIVE_PROGRESS_HEIGHT = 200               # Höhe des Fortschritts-iFrames in Pixeln
+
+GENRE_COLORS = {
+    "Deep House": {
+        "primary": "#1a1a2e",
+        "secondary": "#16213e", 
+        "accent": "#0f3460",
+        "highlight": "#533483"
+    },
+    "Synthpop": {
+        "primary": "#ff006e",
+        "secondary": "#8338ec",
+        "accent": "#3a86ff",
+        "highlight": "#06ffa5"
+    },
+    "Trap": {
+        "primary": "#2d2d2d",
+        "secondary": "#ff6b35",
+        "accent": "#f7931e",
+        "highlight": "#ffb627"
+    },
+    "Techno": {
+        "primary": "#000000",
+        "secondary": "#333333",
+        "accent": "#666666",
+        "highlight": "#00ff00"
+    },
+    "Ambient": {
+        "primary": "#e8f4f8",
+        "secondary": "#b8d4da",
+        "accent": "#88b4bc",
+        "highlight": "#5894a0"
+    },
+    "Drum & Bass": {
+        "primary": "#1a0033",
+        "secondary": "#330066",
+        "accent": "#4d0099",
+        "highlight": "#6600cc"
+    },
+    "Future Bass": {
+        "primary": "#ff0080",
+        "secondary": "#8000ff",
+        "accent": "#0080ff",
+        "highlight": "#00ffff"
+    },
+    "Lo-Fi Hip Hop": {
+        "primary": "#8b4513",
+        "secondary": "#cd853f",
+        "accent": "#daa520",
+        "highlight": "#ffd700"
+    },
+    "Psytrance": {
+        "primary": "#4b0082",
+        "secondary": "#8a2be2",
+        "accent": "#9932cc",
+        "highlight": "#da70d6"
+    },
+    "Indie Pop": {
+        "primary": "#ff69b4",
+        "secondary": "#ff1493",
+        "accent": "#dc143c",
+        "highlight": "#b22222"
+    },
+    "Hardstyle": {
+        "primary": "#ff0000",
+        "secondary": "#cc0000",
+        "accent": "#990000",
+        "highlight": "#ffff00"
     }
-    return color_schemes.get(genre, color_schemes["Deep House"])
+}
 
-def create_animated_progress_bar(progress: float, phase: str, genre: str = "Deep House") -> str:
-    """Erstellt einen animierten Fortschrittsbalken mit genre-spezifischen Farben"""
-    colors = get_genre_colors(genre)
-    
-    return f"""
-    <div style="margin: 20px 0;">
-        <div style="
-            background: linear-gradient(90deg, {colors['primary']}, {colors['secondary']});
-            border-radius: 25px;
-            padding: 3px;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.2);
-        ">
-            <div style="
-                background: linear-gradient(90deg, {colors['accent']}, {colors['highlight']});
-                width: {progress}%;
-                height: 30px;
-                border-radius: 22px;
-                transition: width 0.5s ease-in-out;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                color: white;
-                font-weight: bold;
-                font-size: 14px;
-                text-shadow: 1px 1px 2px rgba(0,0,0,0.5);
-                animation: pulse 2s infinite;
-            ">
-                {progress:.0f}%
-            </div>
-        </div>
-        <div style="
-            text-align: center;
-            margin-top: 10px;
-            font-size: 16px;
-            font-weight: bold;
-            color: {colors['accent']};
-            animation: fadeInOut 2s infinite;
-        ">
-            {phase}
+
+@dataclass(frozen=True, slots=True)
+class GenreTheme:
+    """Einmal pro Genre berechnete Farben und CSS-Variablen"""
+    genre: str
+    colors: Mapping[str, str]
+    css_vars: str                        # für die Styles aus assets/css/components.css
+
+
+@lru_cache(maxsize=THEME_CACHE)
+def get_genre_theme(genre: str) -> GenreTheme:
+    colors = GENRE_COLORS.get(genre, GENRE_COLORS[DEFAULT_GENRE])
+    return GenreTheme(
+        genre=genre,
+        colors=MappingProxyType(colors),
+        css_vars="; ".join(f"--genre-{name}: {value}" for name, value in colors.items())
+    )
+
+def get_genre_colors(genre: str) -> Mapping[str, str]:
+    """Gibt genre-spezifische Farbschemata zurück"""
+    return get_genre_theme(genre).colors
+
+def genre_css_vars(genre: str) -> str:
+    """Genre-Farben als CSS-Variablen für die Styles aus assets/css/components.css"""
+    return get_genre_theme(genre).css_vars
+
+@lru_cache(maxsize=THEME_CACHE)
+def _progress_bar_shell(genre: str) -> tuple[str, ...]:
+    """Statisches Markup des Fortschrittsbalkens, aufgeteilt an den dynamischen Stellen"""
+    return tuple(f"""
+    <div class="progress-shell" style="{genre_css_vars(genre)}">
+        <div class="progress-track">
+            <div class="progress-fill" style="width: {_SLOT}%">{_SLOT}%</div>
         </div>
+        <div class="progress-phase">{_SLOT}</div>
     </div>
-    
-    <style>
-        @keyframes pulse {{
-            0% {{ transform: scale(1); }}
-            50% {{ transform: scale(1.02); }}
-            100% {{ transform: scale(1); }}
-        }}
-        
-        @keyframes fadeInOut {{
-            0% {{ opacity: 0.7; }}
-            50% {{ opacity: 1; }}
-            100% {{ opacity: 0.7; }}
-        }}
-    </style>
-    """
+    """.split(_SLOT))
 
+def create_animated_progress_bar(progress: float, phase: str, genre: str = "Deep House") -> str:
+    """Erstellt einen animierten Fortschrittsbalken mit genre-spezifischen Farben"""
+    head, bar, label, tail = _progress_bar_shell(genre)
+    return f"{head}{progress}{bar}{progress:.0f}{label}{phase}{tail}"
+
+@lru_cache(maxsize=THEME_CACHE)
 def create_floating_music_notes(genre: str = "Deep House") -> str:
     """Erstellt schwebende Musiknoten-Animation"""
-    colors = get_genre_colors(genre)
-    
     return f"""
-    <div class="music-notes-container">
+    <div class="music-notes-container" style="{genre_css_vars(genre)}">
         <div class="music-note note1">♪</div>
         <div class="music-note note2">♫</div>
         <div class="music-note note3">♪</div>
         <div class="music-note note4">♬</div>
         <div class="music-note note5">♫</div>
     </div>
-    
-    <style>
-        .music-notes-container {{
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            pointer-events: none;
-            z-index: 1000;
-        }}
-        
-        .music-note {{
-            position: absolute;
-            font-size: 24px;
-            color: {colors['highlight']};
-            opacity: 0.7;
-            animation: floatUp 8s infinite linear;
-        }}
-        
-        .note1 {{
-            left: 10%;
-            animation-delay: 0s;
-        }}
-        
-        .note2 {{
-            left: 25%;
-            animation-delay: 2s;
-        }}
-        
-        .note3 {{
-            left: 50%;
-            animation-delay: 4s;
-        }}
-        
-        .note4 {{
-            left: 75%;
-            animation-delay: 6s;
-        }}
-        
-        .note5 {{
-            left: 90%;
-            animation-delay: 1s;
-        }}
-        
-        @keyframes floatUp {{
-            0% {{
-                transform: translateY(100vh) rotate(0deg);
-                opacity: 0;
-            }}
-            10% {{
-                opacity: 0.7;
-            }}
-            90% {{
-                opacity: 0.7;
-            }}
-            100% {{
-                transform: translateY(-100px) rotate(360deg);
-                opacity: 0;
-            }}
-        }}
-    </style>
     """
 
+@lru_cache(maxsize=THEME_CACHE)
 def create_ai_avatar_animation(genre: str = "Deep House") -> str:
     """Erstellt einen pulsierenden KI-Avatar"""
-    colors = get_genre_colors(genre)
-    
     return f"""
     <div style="
+        {genre_css_vars(genre)};
         display: flex;
         justify-content: center;
         align-items: center;
@@ -227,37 +157,13 @@ def create_ai_avatar_animation(genre: str = "Deep House") -> str:
             🤖
         </div>
     </div>
-    
-    <style>
-        .ai-avatar {{
-            font-size: 80px;
-            animation: aiPulse 2s infinite;
-            filter: drop-shadow(0 0 20px {colors['highlight']});
-        }}
-        
-        @keyframes aiPulse {{
-            0% {{
-                transform: scale(1);
-                filter: drop-shadow(0 0 20px {colors['highlight']});
-            }}
-            50% {{
-                transform: scale(1.1);
-                filter: drop-shadow(0 0 30px {colors['accent']});
-            }}
-            100% {{
-                transform: scale(1);
-                filter: drop-shadow(0 0 20px {colors['highlight']});
-            }}
-        }}
-    </style>
     """
 
+@lru_cache(maxsize=THEME_CACHE)
 def create_waveform_animation(genre: str = "Deep House") -> str:
     """Erstellt eine Wellenform-Animation"""
-    colors = get_genre_colors(genre)
-    
     return f"""
-    <div class="waveform-container">
+    <div class="waveform-container" style="{genre_css_vars(genre)}">
         <div class="wave-bar bar1"></div>
         <div class="wave-bar bar2"></div>
         <div class="wave-bar bar3"></div>
@@ -267,115 +173,34 @@ def create_waveform_animation(genre: str = "Deep House") -> str:
         <div class="wave-bar bar7"></div>
         <div class="wave-bar bar8"></div>
     </div>
-    
-    <style>
-        .waveform-container {{
-            display: flex;
-            justify-content: center;
-            align-items: end;
-            height: 60px;
-            margin: 20px 0;
-            gap: 3px;
-        }}
-        
-        .wave-bar {{
-            width: 8px;
-            background: linear-gradient(to top, {colors['accent']}, {colors['highlight']});
-            border-radius: 4px;
-            animation: waveform 1.5s infinite ease-in-out;
-        }}
-        
-        .bar1 {{ animation-delay: 0s; }}
-        .bar2 {{ animation-delay: 0.1s; }}
-        .bar3 {{ animation-delay: 0.2s; }}
-        .bar4 {{ animation-delay: 0.3s; }}
-        .bar5 {{ animation-delay: 0.4s; }}
-        .bar6 {{ animation-delay: 0.5s; }}
-        .bar7 {{ animation-delay: 0.6s; }}
-        .bar8 {{ animation-delay: 0.7s; }}
-        
-        @keyframes waveform {{
-            0%, 100% {{
-                height: 10px;
-            }}
-            50% {{
-                height: 50px;
-            }}
-        }}
-    </style>
     """
 
-def create_status_card(title: str, message: str, genre: str = "Deep House", show_time: bool = True) -> str:
-    """Erstellt eine animierte Status-Karte"""
-    colors = get_genre_colors(genre)
-    current_time = time.strftime("%H:%M:%S") if show_time else ""
-    
-    return f"""
-    <div class="status-card">
+@lru_cache(maxsize=THEME_CACHE)
+def _status_card_shell(genre: str) -> tuple[str, ...]:
+    """Statisches Markup der Status-Karte, aufgeteilt an Titel, Zeitstempel und Nachricht"""
+    return tuple(f"""
+    <div class="status-card" style="{genre_css_vars(genre)}">
         <div class="status-header">
-            <h3>{title}</h3>
-            {f'<span class="timestamp">{current_time}</span>' if show_time else ''}
+            <h3>{_SLOT}</h3>
+            {_SLOT}
         </div>
         <div class="status-message">
-            {message}
+            {_SLOT}
         </div>
     </div>
-    
-    <style>
-        .status-card {{
-            background: linear-gradient(135deg, {colors['primary']}, {colors['secondary']});
-            border-radius: 15px;
-            padding: 20px;
-            margin: 15px 0;
-            box-shadow: 0 8px 25px rgba(0,0,0,0.3);
-            border: 2px solid {colors['accent']};
-            animation: slideInFromLeft 0.5s ease-out;
-        }}
-        
-        .status-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 10px;
-        }}
-        
-        .status-header h3 {{
-            color: {colors['highlight']};
-            margin: 0;
-            font-size: 18px;
-        }}
-        
-        .timestamp {{
-            color: {colors['accent']};
-            font-size: 12px;
-            opacity: 0.8;
-        }}
-        
-        .status-message {{
-            color: white;
-            font-size: 14px;
-            line-height: 1.4;
-        }}
-        
-        @keyframes slideInFromLeft {{
-            0% {{
-                transform: translateX(-100%);
-                opacity: 0;
-            }}
-            100% {{
-                transform: translateX(0);
-                opacity: 1;
-            }}
-        }}
-    </style>
-    """
+    """.split(_SLOT))
+
+def create_status_card(title: str, message: str, genre: str = "Deep House", show_time: bool = True) -> str:
+    """Erstellt eine animierte Status-Karte"""
+    head, header, body, tail = _status_card_shell(genre)
+    timestamp = f'<span class="timestamp">{time.strftime("%H:%M:%S")}</span>' if show_time else ''
+    return f"{head}{title}{header}{timestamp}{body}{message}{tail}"
 
+@lru_cache(maxsize=THEME_CACHE)
 def create_enhanced_loading_spinner(genre: str = "Deep House") -> str:
     """Erstellt einen verbesserten Loading-Spinner"""
-    colors = get_genre_colors(genre)
-    
     return f"""
-    <div class="enhanced-spinner-container">
+    <div class="enhanced-spinner-container" style="{genre_css_vars(genre)}">
         <div class="enhanced-spinner">
             <div class="spinner-ring ring1"></div>
             <div class="spinner-ring ring2"></div>
@@ -383,102 +208,108 @@ def create_enhanced_loading_spinner(genre: str = "Deep House") -> str:
             <div class="spinner-center">🎵</div>
         </div>
     </div>
-    
-    <style>
-        .enhanced-spinner-container {{
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            margin: 30px 0;
-        }}
-        
-        .enhanced-spinner {{
-            position: relative;
-            width: 100px;
-            height: 100px;
-        }}
-        
-        .spinner-ring {{
-            position: absolute;
-            border-radius: 50%;
-            border: 3px solid transparent;
-        }}
-        
-        .ring1 {{
-            width: 100px;
-            height: 100px;
-            border-top: 3px solid {colors['highlight']};
-            animation: spin 2s linear infinite;
-        }}
-        
-        .ring2 {{
-            width: 80px;
-            height: 80px;
-            top: 10px;
-            left: 10px;
-            border-right: 3px solid {colors['accent']};
-            animation: spin 1.5s linear infinite reverse;
-        }}
-        
-        .ring3 {{
-            width: 60px;
-            height: 60px;
-            top: 20px;
-            left: 20px;
-            border-bottom: 3px solid {colors['secondary']};
-            animation: spin 1s linear infinite;
-        }}
-        
-        .spinner-center {{
-            position: absolute;
-            top: 50%;
-            left: 50%;
-            transform: translate(-50%, -50%);
-            font-size: 24px;
-            animation: pulse 2s infinite;
-        }}
-        
-        @keyframes spin {{
-            0% {{ transform: rotate(0deg); }}
-            100% {{ transform: rotate(360deg); }}
-        }}
-    </style>
     """
 
+# Fortschritt wird im Browser aus Startzeit und ETA interpoliert:
+# 0 → 50 % bis zum Median, 50 → 90 % bis zum 90. Perzentil, danach asymptotisch gegen 95 %
+_LIVE_PROGRESS_SCRIPT = """
+<script>
+const cfg = JSON.parse(document.getElementById("live-progress-config").textContent);
+const loadedAt = performance.now();
+const fill = document.querySelector(".progress-fill");
+const phase = document.querySelector(".progress-phase");
+const message = document.querySelector(".status-message");
+
+function progressAt(elapsed) {
+    if (cfg.progress !== null) return cfg.progress;
+    // Ohne Messwerte kann die ETA 0 sein; die Untergrenzen verhindern NaN und Sprünge
+    const p50 = Math.max(cfg.eta[0], 1);
+    const p90 = Math.max(cfg.eta[1], p50 + 1);
+    if (elapsed <= p50) return 50 * elapsed / p50;
+    if (elapsed <= p90) return 50 + 40 * (elapsed - p50) / (p90 - p50);
+    return 95 - 5 * Math.exp(-(elapsed - p90) / p90);
+}
+
+function phaseAt(elapsed) {
+    for (const [name, until] of cfg.phases) {
+        if (until === null || elapsed <= until) return name;
+    }
+    return cfg.phases[cfg.phases.length - 1][0];
+}
+
+function tick() {
+    const elapsed = cfg.elapsed + (performance.now() - loadedAt) / 1000;
+    const progress = progressAt(elapsed);
+    fill.style.width = progress + "%";
+    fill.textContent = Math.floor(progress) + "%";
+    phase.textContent = phaseAt(elapsed);
+    message.textContent = cfg.message.replace("{elapsed}", Math.floor(elapsed));
+}
+
+tick();
+setInterval(tick, 500);
+</script>
+"""
+
+def create_live_progress(genre: str, stylesheet: str, elapsed: float, eta: tuple[float, float],
+                         phases: list[tuple[str, float | None]], message: str,
+                         progress: float | None = None) -> str:
+    """
+    Eigenständige Fortschrittsanzeige für ein iFrame. Der Server liefert sie nur
+    bei Statuswechseln neu; dazwischen zählt der Browser selbst hoch.
+    phases: (Name, bis Sekunde) – None gilt bis zum Ende; message darf {elapsed} enthalten;
+    progress fixiert den Balken (z.B. 100 nach einer abgeschlossenen Phase).
+    """
+    config = json.dumps({
+        "elapsed": elapsed, "eta": list(eta), "phases": phases,
+        "message": message, "progress": progress
+    }).replace("</", "<\\/")
+    return (
+        f"{stylesheet}<style>body {{ margin: 0; background: transparent; font-family: var(--app-font); }}</style>"
+        f"{create_animated_progress_bar(0, '', genre)}"
+        f"{create_status_card('Status Update', '', genre, show_time=False)}"
+        f'<script type="application/json" id="live-progress-config">{config}</script>'
+        f"{_LIVE_PROGRESS_SCRIPT}"
+    )
+
+def show_live_progress(*args, **kwargs) -> None:
+    """Bindet create_live_progress als iFrame ein"""
+    html = create_live_progress(*args, **kwargs)
+    if hasattr(st, "iframe"):            # components.v1.html ist ab Streamlit 1.5x veraltet
+        st.iframe(html, height=LIVE_PROGRESS_HEIGHT)
+    else:
+        components.html(html, height=LIVE_PROGRESS_HEIGHT)
+
+def show_progress_frame(genre: str, render_progress) -> None:
+    """Statische Animationen um einen dynamischen Fortschrittsbereich (z.B. ein Fragment)"""
+    st.markdown(create_floating_music_notes(genre), unsafe_allow_html=True)
+    st.markdown(create_ai_avatar_animation(genre), unsafe_allow_html=True)
+    render_progress()
+    st.markdown(create_waveform_animation(genre), unsafe_allow_html=True)
+    st.markdown(create_enhanced_loading_spinner(genre), unsafe_allow_html=True)
+
 def show_enhanced_progress(phase: str, progress: float, genre: str, additional_info: str = "") -> None:
-    """Zeigt den verbesserten Fortschritt mit allen visuellen Elementen an"""
-    
-    # Container für alle visuellen Elemente
-    progress_container = st.container()
-    
-    with progress_container:
-        # Schwebende Musiknoten im Hintergrund
+    """Zeigt einen festen Fortschrittsstand mit allen visuellen Elementen an
+
+    Für laufende Phasen gibt es show_live_progress, das im Browser weiterzählt.
+    """
+    with st.container():
         st.markdown(create_floating_music_notes(genre), unsafe_allow_html=True)
-        
-        # KI-Avatar Animation
         st.markdown(create_ai_avatar_animation(genre), unsafe_allow_html=True)
-        
-        # Hauptfortschrittsbalken
         st.markdown(create_animated_progress_bar(progress, phase, genre), unsafe_allow_html=True)
-        
-        # Wellenform-Animation
         st.markdown(create_waveform_animation(genre), unsafe_allow_html=True)
-        
-        # Status-Karte mit zusätzlichen Informationen
         if additional_info:
             st.markdown(create_status_card("Status Update", additional_info, genre), unsafe_allow_html=True)
-        
-        # Loading-Spinner für aktive Phasen
+        # Loading-Spinner nur für noch aktive Phasen
         if progress < 100:
             st.markdown(create_enhanced_loading_spinner(genre), unsafe_allow_html=True)
 
-def create_completion_celebration(genre: str) -> str:
-    """Erstellt eine Feier-Animation für die Fertigstellung"""
-    colors = get_genre_colors(genre)
-    
+@lru_cache(maxsize=THEME_CACHE)
+def create_completion_celebration(genre: str, text: str = "🎉 Song erfolgreich erstellt! 🎉") -> str:
+    """Erstellt eine Feier-Animation für die Fertigstellung (gecacht pro Genre und Sprachtext)"""
     return f"""
-    <div class="celebration-container">
-        <div class="celebration-text">🎉 Song erfolgreich erstellt! 🎉</div>
+    <div class="celebration-container" style="{genre_css_vars(genre)}">
+        <div class="celebration-text">{text}</div>
         <div class="confetti">
             <div class="confetti-piece piece1">🎵</div>
             <div class="confetti-piece piece2">🎶</div>
@@ -487,56 +318,5 @@ def create_completion_celebration(genre: str) -> str:
             <div class="confetti-piece piece5">🎶</div>
         </div>
     </div>
-    
-    <style>
-        .celebration-container {{
-            text-align: center;
-            margin: 30px 0;
-            position: relative;
-        }}
-        
-        .celebration-text {{
-            font-size: 24px;
-            font-weight: bold;
-            color: {colors['highlight']};
-            animation: celebrationBounce 1s ease-in-out infinite;
-        }}
-        
-        .confetti {{
-            position: absolute;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100px;
-        }}
-        
-        .confetti-piece {{
-            position: absolute;
-            font-size: 20px;
-            animation: confettiFall 3s ease-out infinite;
-        }}
-        
-        .piece1 {{ left: 10%; animation-delay: 0s; }}
-        .piece2 {{ left: 30%; animation-delay: 0.5s; }}
-        .piece3 {{ left: 50%; animation-delay: 1s; }}
-        .piece4 {{ left: 70%; animation-delay: 1.5s; }}
-        .piece5 {{ left: 90%; animation-delay: 2s; }}
-        
-        @keyframes celebrationBounce {{
-            0%, 100% {{ transform: scale(1); }}
-            50% {{ transform: scale(1.1); }}
-        }}
-        
-        @keyframes confettiFall {{
-            0% {{
-                transform: translateY(-100px) rotate(0deg);
-                opacity: 1;
-            }}
-            100% {{
-                transform: translateY(200px) rotate(360deg);
-                opacity: 0;
-            }}
-        }}
-    </style>
     """
 
@@ -0,0 +1,163 @@
+"""
+Laufzeitstatistik für den KI Song-Agent
+Gemessene Dauern (Songtexte, erste Vorschau, fertiger Render) werden pro
+Schlüssel gesammelt, etwa Suno-Modell, Instrumental und Textlänge, und in
+HISTORY_FILE fortgeschrieben. Daraus wird je Schlüssel eine Log-Normal-
+Verteilung geschätzt, die Fortschrittsanzeige und Abfragetakt speist. Gibt es
+für einen Schlüssel zu wenige Messungen, wird auf den nächst gröberen
+ausgewichen (ohne Textlänge, ohne Instrumental, nur die Stufe) und zuletzt auf
+feste Startwerte.
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+from statistics import NormalDist, fmean, pstdev
+
+HISTORY_FILE = "render_times.jsonl"
+MAX_SAMPLES  = 200                       # jüngste Messungen pro Schlüssel
+MIN_SAMPLES  = 5                         # darunter gilt ein Schlüssel als zu dünn besetzt
+PRIORS       = {                         # (Median, 90. Perzentil) in Sekunden ohne Messwerte
+    "lyrics": (15, 45),
+    "stream": (45, 90),
+    "render": (150, 240),
+}
+MIN_SIGMA    = 0.1                       # hält die Verteilung auch bei fast gleichen Messungen breit genug
+WINDOW       = (0.1, 0.95)               # Quantile, zwischen denen ein Ergebnis erwartet wird
+COMPACT_AFTER = 5000                     # ab so vielen Zeilen wird die Datei beim Laden gekürzt
+
+_Z90 = NormalDist().inv_cdf(0.9)
+
+
+def lyrics_bucket(lyrics: str) -> str:
+    """Grobe Textlänge als Teil des Schlüssels"""
+    if len(lyrics) < 1000:
+        return "short"
+    return "medium" if len(lyrics) < 2500 else "long"
+
+
+def render_key(model: str, instrumental: bool, lyrics: str) -> tuple:
+    """Schlüssel für Stream- und Render-Dauern; bei Instrumentals zählt die Textlänge nicht"""
+    if instrumental:
+        return (model, "instrumental")
+    return (model, "vocals", lyrics_bucket(lyrics))
+
+
+class Estimate:
+    """Log-Normal-Verteilung einer Dauer"""
+    __slots__ = ("mu", "sigma", "samples")
+
+    def __init__(self, mu: float, sigma: float, samples: int = 0):
+        self.mu = mu
+        self.sigma = max(sigma, MIN_SIGMA)
+        self.samples = samples
+
+    @classmethod
+    def from_quantiles(cls, median: float, p90: float) -> "Estimate":
+        mu = math.log(median)
+        return cls(mu, (math.log(p90) - mu) / _Z90)
+
+    @classmethod
+    def fit(cls, durations) -> "Estimate":
+        logs = [math.log(max(d, 1.0)) for d in durations]
+        return cls(fmean(logs), pstdev(logs), len(logs))
+
+    def quantile(self, p: float) -> float:
+        return math.exp(self.mu + self.sigma * NormalDist().inv_cdf(p))
+
+    @property
+    def eta(self) -> tuple[float, float]:
+        """(Median, 90. Perzentil) für die Fortschrittsanzeige"""
+        return self.quantile(0.5), self.quantile(0.9)
+
+    def window(self) -> tuple[float, float]:
+        """Zeitraum, in dem das Ergebnis wahrscheinlich eintrifft; dort wird dicht abgefragt"""
+        return self.quantile(WINDOW[0]), self.quantile(WINDOW[1])
+
+
+class EtaModel:
+    """Sammelt Dauern pro Stufe und Schlüssel und liefert Schätzungen mit Rückfall auf gröbere Schlüssel"""
+
+    def __init__(self, path: str | None = HISTORY_FILE, priors: dict | None = None,
+                 max_samples: int = MAX_SAMPLES, min_samples: int = MIN_SAMPLES):
+        self._path = path
+        self._priors = {**PRIORS, **(priors or {})}
+        self._max_samples = max_samples
+        self._min_samples = min_samples
+        self._lock = threading.Lock()
+        self._samples: dict[tuple, deque[float]] = {}
+        self._cache: dict[tuple, Estimate] = {}
+        self._load()
+
+    def record(self, stage: str, key: tuple, seconds: float) -> None:
+        """Vermerkt eine gemessene Dauer; sie zählt auch für alle gröberen Schlüssel"""
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._add(stage, key, seconds)
+            if self._path:
+                line = json.dumps({"stage": stage, "key": list(key), "seconds": round(seconds, 2),
+                                   "at": round(time.time())}, ensure_ascii=False)
+                try:
+                    with open(self._path, 'a', encoding='utf-8') as f:
+                        f.write(line + "\n")
+                except OSError:
+                    pass                 # ohne Schreibrechte bleibt die Statistik im Speicher
+
+    def estimate(self, stage: str, key: tuple = ()) -> Estimate:
+        """Verteilung für den feinsten Schlüssel mit genug Messungen, sonst der Startwert der Stufe"""
+        with self._lock:
+            for size in range(len(key), -1, -1):
+                full = (stage, *key[:size])
+                samples = self._samples.get(full)
+                if samples is not None and len(samples) >= self._min_samples:
+                    if full not in self._cache:
+                        self._cache[full] = Estimate.fit(samples)
+                    return self._cache[full]
+        return Estimate.from_quantiles(*self._priors[stage])
+
+    def _add(self, stage: str, key: tuple, seconds: float) -> None:
+        for size in range(len(key) + 1):
+            full = (stage, *key[:size])
+            self._samples.setdefault(full, deque(maxlen=self._max_samples)).append(seconds)
+            self._cache.pop(full, None)
+
+    def _load(self) -> None:
+        if not self._path or not os.path.exists(self._path):
+            return
+        lines = 0
+        kept: dict[tuple, deque[str]] = {}   # jüngste Zeilen pro vollständigem Schlüssel
+        with open(self._path, 'r', encoding='utf-8') as f:
+            for line in f:
+                lines += 1
+                try:
+                    entry = json.loads(line)
+                    if entry["stage"] in self._priors:
+                        self._add(entry["stage"], tuple(entry["key"]), float(entry["seconds"]))
+                        full = (entry["stage"], *entry["key"])
+                        kept.setdefault(full, deque(maxlen=self._max_samples)).append(line)
+                except (ValueError, KeyError, TypeError):
+                    continue             # abgebrochene Zeile nach einem Absturz
+        if lines > COMPACT_AFTER:
+            self._compact(kept)
+
+    def _compact(self, kept: dict[tuple, deque[str]]) -> None:
+        """Schreibt nur die Zeilen zurück, die noch in eine Schätzung eingehen"""
+        tmp_path = f"{self._path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for lines in kept.values():
+                    f.writelines(lines)
+            os.replace(tmp_path, self._path)
+        except OSError:
+            pass
+
+
+@lru_cache(maxsize=1)
+def default_eta_model() -> EtaModel:
+    """Prozessweite Statistik für Oberfläche, Fan-out und Batch"""
+    return EtaModel()
@@ -0,0 +1,122 @@
+"""
+Genre-Katalog für den KI Song-Agent
+Lädt die Genre-Stilbeschreibungen einmal pro Prozess aus data/genres.json in
+unveränderliche, kompakte Strukturen. Pro Sprache wird eine aufgelöste Ansicht
+vorberechnet, sodass beim Rendern keine Sprach-Fallbacks mehr nötig sind.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
+
+GENRES_FILE      = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "genres.json")
+DEFAULT_LANGUAGE = "en"
+LOCALIZED_FIELDS = ("instrumentation", "vocals", "mood", "description", "characteristics", "examples")
+FALLBACK_STYLES  = {
+    "en": "Emotional ballad with piano and strings",
+    "de": "Emotionale Ballade mit Piano und Strings"
+}
+
+
+@dataclass(frozen=True, slots=True)
+class GenreView:
+    """Ein Genre, aufgelöst für eine Sprache"""
+    name: str
+    tempo: str
+    instrumentation: str
+    vocals: str
+    mood: str
+    description: str
+    characteristics: tuple[str, ...]
+    examples: str
+    style_description: str
+
+
+@dataclass(frozen=True, slots=True)
+class Genre:
+    name: str
+    tempo: str
+    views: Mapping[str, GenreView]
+
+    def view(self, lang: str) -> GenreView:
+        return self.views.get(lang) or self.views[DEFAULT_LANGUAGE]
+
+    def prompt_context(self) -> dict:
+        """Genre-Kontext für den Lyrics-Prompt im bisherigen Format"""
+        return {
+            "tempo": self.tempo,
+            "mood": {lang: view.mood for lang, view in self.views.items()},
+            "description": {lang: view.description for lang, view in self.views.items()}
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class GenreCatalog:
+    genres: Mapping[str, Genre]
+    names: tuple[str, ...]
+    languages: tuple[str, ...]
+    version: str                         # Inhalts-Hash der Datendatei
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.genres
+
+    def __getitem__(self, name: str) -> Genre:
+        return self.genres[name]
+
+    def view(self, name: str, lang: str) -> GenreView | None:
+        genre = self.genres.get(name)
+        return genre.view(lang) if genre else None
+
+    def prompt_context(self, name: str) -> dict:
+        genre = self.genres.get(name)
+        return genre.prompt_context() if genre else {}
+
+    def style_description(self, name: str, custom_style: str = "", lang: str = DEFAULT_LANGUAGE) -> str:
+        """Generiert Stilbeschreibung basierend auf Genre-Auswahl"""
+        if name == "Custom" and custom_style:
+            return custom_style
+        view = self.view(name, lang)
+        if view is not None:
+            return view.style_description
+        return FALLBACK_STYLES.get(lang, FALLBACK_STYLES[DEFAULT_LANGUAGE])
+
+
+def _resolve(field: dict, lang: str):
+    """Sprachwert mit Fallback auf die Standardsprache"""
+    return field.get(lang, field.get(DEFAULT_LANGUAGE, ""))
+
+def _build_genre(name: str, info: dict, languages: tuple[str, ...]) -> Genre:
+    views = {}
+    for lang in languages:
+        fields = {key: _resolve(info[key], lang) for key in LOCALIZED_FIELDS}
+        fields["characteristics"] = tuple(fields["characteristics"] or ())
+        style_description = (
+            f"Genre: {name}, Tempo: {info['tempo']}, Instrumentation: {fields['instrumentation']}, "
+            f"Vocals: {fields['vocals']}, Mood: {fields['mood']}"
+        )
+        views[lang] = GenreView(name=name, tempo=info["tempo"], style_description=style_description, **fields)
+    return Genre(name=name, tempo=info["tempo"], views=MappingProxyType(views))
+
+def load_genre_catalog(path: str = GENRES_FILE) -> GenreCatalog:
+    """Liest und kompiliert den Genre-Katalog aus der Datendatei"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    data = json.loads(raw)
+    # Reihenfolge wie in der Datendatei, damit der Prompt-Kontext unverändert bleibt
+    languages = tuple(dict.fromkeys(lang for info in data.values() for key in LOCALIZED_FIELDS for lang in info[key]))
+    genres = {name: _build_genre(name, info, languages) for name, info in data.items()}
+    return GenreCatalog(
+        genres=MappingProxyType(genres),
+        names=tuple(genres),
+        languages=languages,
+        version=hashlib.sha1(raw).hexdigest()[:12]
+    )
+
+@lru_cache(maxsize=1)
+def default_catalog() -> GenreCatalog:
+    """Prozessweit geteilter Katalog für Code außerhalb von Streamlit"""
+    return load_genre_catalog()
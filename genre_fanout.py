@@ -0,0 +1,322 @@
+"""
+Genre-Fan-out für den KI Song-Agent
+Eine Beschreibung, mehrere Genres: Lyrics werden einmal (bzw. einmal pro
+Genre-Familie) generiert, alle Suno-Renders parallel gestartet und
+gemeinsam abgefragt. Die Gesamtdauer nähert sich so einem einzelnen Render.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from lyrics_generator import generate_lyrics_with_ollama
+from suno_client import (
+    build_song_payload,
+    get_task_info,
+    is_generation_complete
+)
+from account_pool import AccountPool, ensure_pool
+from admission import AdmissionController, Ticket, default_admission
+from deadline import JOB_DEADLINE, Deadline, DeadlineExceeded
+from eta_model import EtaModel, default_eta_model, render_key
+from health import CircuitOpen
+from profiles import GenerationProfile, get_profile
+from submission_cache import SubmissionCache, default_submissions
+
+# Genres mit ähnlicher Songstruktur teilen sich dieselben Lyrics
+GENRE_FAMILIES = {
+    "Electronic": ("Deep House", "Synthpop", "Trap", "Techno", "Ambient", "Drum & Bass",
+                   "Future Bass", "Psytrance", "Hardstyle"),
+    "Hip Hop": ("Lo-Fi Hip Hop", "Reggaeton"),
+    "Pop/Rock": ("Indie Pop", "Pop Rock", "Alternative Rock", "Alternative Metal"),
+    "Traditional": ("Jazz", "Classical", "R&B", "Soul", "Country", "Folk", "Blues", "Reggae"),
+    "Emotional": ("Piano Ballad", "Emotional", "Romantic", "Acoustic"),
+}
+
+MAX_RENDER_WORKERS = 8                   # parallele Suno-Aufrufe pro Fan-out
+MAX_POLL_ERRORS    = 5                   # Verbindungsfehler bis ein Render aufgibt
+
+def genre_family(genre: str) -> str:
+    """Gibt die Genre-Familie zurück, unbekannte Genres bilden eine eigene Familie"""
+    for family, genres in GENRE_FAMILIES.items():
+        if genre in genres:
+            return family
+    return genre
+
+
+class GenreFanout:
+    """Rendert eine Song-Idee in mehreren Genres im Hintergrund"""
+
+    TERMINAL = ("done", "failed")
+
+    def __init__(self, accounts: AccountPool | str, song_description: str, styles: dict[str, str],
+                 genre_infos: dict[str, dict], instrumental: bool = False,
+                 lyrics_per_family: bool = True, submissions: SubmissionCache | None = None,
+                 admission: AdmissionController | None = None, owner: str = "default",
+                 deadline: float = JOB_DEADLINE, profile: GenerationProfile | None = None,
+                 eta_model: EtaModel | None = None):
+        self._accounts = ensure_pool(accounts)
+        self._admission = admission or default_admission()
+        self._owner = owner
+        self._tickets: dict[str, Ticket] = {}    # Suno-Plätze pro Genre, bis der Render abgeschlossen ist
+        self._submissions = submissions or default_submissions()
+        self.song_description = song_description
+        self.instrumental = instrumental
+        self._genre_infos = genre_infos
+        self._lyrics_per_family = lyrics_per_family
+        self._budget = deadline          # Sekunden ab start() für alle Genres gemeinsam
+        self.profile = profile or get_profile()
+        self._eta = eta_model or default_eta_model()
+        self._next_poll: dict[str, float] = {}   # nächste Abfrage pro Genre nach der Laufzeitstatistik
+        self._deadline: Deadline | None = None
+        self._lock = threading.Lock()
+        self._pool: ThreadPoolExecutor | None = None
+        self.started_at: float | None = None
+        # Pro Genre ein Zustands-Dict; "rev" zählt jede Änderung für die UI
+        self.variants = {
+            genre: {
+                "genre": genre, "style": style, "status": "queued", "lyrics": "",
+                "task_id": None, "submission_key": None, "api_key": None, "tracks": [], "error": None, "errors": 0,
+                "queue": None, "submitted_at": None, "finished_at": None, "shared": False, "rev": 0
+            }
+            for genre, style in styles.items()
+        }
+
+    @property
+    def done(self) -> bool:
+        return all(v["status"] in self.TERMINAL for v in self.variants.values())
+
+    def snapshot(self) -> list[dict]:
+        """Konsistente Kopie aller Varianten für die Anzeige"""
+        with self._lock:
+            return [dict(v) for v in self.variants.values()]
+
+    def start(self) -> None:
+        self.started_at = time.time()
+        self._deadline = Deadline(self._budget)
+        self._pool = ThreadPoolExecutor(max_workers=MAX_RENDER_WORKERS)
+        threading.Thread(target=self._generate_and_submit, daemon=True).start()
+        threading.Thread(target=self._poll_loop, daemon=True).start()
+
+    def _update(self, genre: str, **changes) -> None:
+        with self._lock:
+            variant = self.variants[genre]
+            if variant["status"] in self.TERMINAL:
+                # Abgebrochene Varianten bleiben beendet, auch wenn ein Pool-Thread noch nachmeldet
+                return
+            variant.update(changes)
+            variant["rev"] += 1
+            ticket = self._tickets.pop(genre, None) if variant["status"] in self.TERMINAL else None
+        if ticket is not None:
+            self._admission.release(ticket)
+
+    def _set(self, genre: str, **changes) -> None:
+        """Interne Zähler unter der Sperre ändern, ohne die UI neu aufzubauen"""
+        with self._lock:
+            self.variants[genre].update(changes)
+
+    def _abort(self, genre: str, error: Exception | str) -> None:
+        """Gibt einen laufenden Auftrag im Cache frei und markiert die Variante als fehlgeschlagen"""
+        variant = self.variants[genre]
+        if variant["submission_key"] is not None:
+            self._submissions.discard(variant["submission_key"], variant["task_id"])
+        self._update(genre, status="failed", error=str(error), queue=None, finished_at=time.time())
+
+    def _abort_open(self, error: Exception, unqueued_only: bool = False) -> None:
+        """Beendet offene Varianten, wenn ein Hintergrund-Thread unerwartet abbricht
+
+        Mit unqueued_only nur die, die noch kein Suno-Ticket haben; die übrigen führt die Abfragerunde weiter.
+        """
+        with self._lock:
+            open_genres = [genre for genre, variant in self.variants.items()
+                           if variant["status"] not in self.TERMINAL
+                           and not (unqueued_only and genre in self._tickets)]
+        for genre in open_genres:
+            self._abort(genre, error)
+
+    def _queued(self, genres: list[str], upstream: str):
+        def on_wait(ahead: int, eta: float) -> None:
+            for genre in genres:
+                self._update(genre, queue={"upstream": upstream, "ahead": ahead, "eta": eta})
+        return on_wait
+
+    def _lyrics_groups(self) -> dict[str, list[str]]:
+        if not self._lyrics_per_family:
+            return {"*": list(self.variants)}
+        groups: dict[str, list[str]] = {}
+        for genre in self.variants:
+            groups.setdefault(genre_family(genre), []).append(genre)
+        return groups
+
+    def _generate_and_submit(self) -> None:
+        try:
+            self._generate_groups()
+        except Exception as e:
+            self._abort_open(e, unqueued_only=True)
+
+    def _generate_groups(self) -> None:
+        # Lyrics nacheinander (ein Ollama-Server), Renders sofort parallel
+        for genres in self._lyrics_groups().values():
+            lead = genres[0]
+            try:
+                with self._admission.slot("ollama", self._owner, songs=len(genres),
+                                          on_wait=self._queued(genres, "ollama"), deadline=self._deadline):
+                    for genre in genres:
+                        self._update(genre, status="lyrics", queue=None)
+                    started = time.time()
+                    lyrics, _ = generate_lyrics_with_ollama(
+                        self.song_description, lead, self.variants[lead]["style"],
+                        self._genre_infos.get(lead, {}), deadline=self._deadline,
+                        **self.profile.lyrics_options()
+                    )
+                    self._eta.record("lyrics", (self.profile.ollama_model, self.profile.candidates),
+                                     time.time() - started)
+                if not lyrics:
+                    raise RuntimeError("Keine Songtexte generiert")
+            except Exception as e:
+                for genre in genres:
+                    self._update(genre, status="failed", error=str(e), finished_at=time.time())
+                continue
+            for genre in genres:
+                # Ohne freien Suno-Platz wartet die Variante; die Abfragerunde reicht sie weiter
+                self._update(genre, status="queued", lyrics=lyrics)
+                with self._lock:
+                    self._tickets[genre] = self._admission.enqueue("suno", self._owner)
+            self._start_admitted()
+
+    def _start_admitted(self) -> None:
+        """Sendet zugelassene Varianten ab und vermerkt bei den übrigen Position und Wartezeit"""
+        with self._lock:
+            # Statuswechsel unter der Sperre, damit keine Variante doppelt abgesendet wird
+            admitted, waiting = [], []
+            for genre, ticket in self._tickets.items():
+                variant = self.variants[genre]
+                if variant["status"] != "queued":
+                    continue
+                if ticket.admitted:
+                    variant.update(status="submitting", queue=None)
+                    variant["rev"] += 1
+                    admitted.append(genre)
+                else:
+                    waiting.append((genre, ticket))
+        for genre in admitted:
+            self._pool.submit(self._submit, genre)
+        if self._deadline.expired:
+            # Nach Ablauf der Frist wird nichts mehr abgesendet; das Ticket wird mit dem Fehlschlag frei
+            for genre, _ in waiting:
+                self._update(genre, status="failed", error="Frist abgelaufen in der Warteschlange: suno",
+                             queue=None, finished_at=time.time())
+            return
+        for genre, ticket in waiting:
+            position = self._admission.position(ticket)
+            if position is not None:
+                self._queued([genre], "suno")(*position)
+
+    def _submit(self, genre: str) -> None:
+        # Läuft im Thread-Pool: ohne Abfangen ginge ein Fehler dort unbemerkt verloren
+        try:
+            self._submit_variant(genre)
+        except Exception as e:
+            self._abort(genre, e)
+
+    def _submit_variant(self, genre: str) -> None:
+        variant = self.variants[genre]
+        payload = build_song_payload(genre, self.song_description, variant["lyrics"],
+                                     variant["style"], self.instrumental, model=self.profile.suno_model)
+        try:
+            submission = self._submissions.submit(payload, self._accounts, deadline=self._deadline)
+            if not submission.task_id:
+                raise RuntimeError("Task-ID fehlt in der Antwort")
+        except RuntimeError as e:
+            self._update(genre, status="failed", error=str(e), finished_at=time.time())
+            return
+        if self.variants[genre]["status"] in self.TERMINAL:
+            # Inzwischen abgebrochen: den Auftrag nicht für andere Sitzungen offen halten
+            self._submissions.discard(submission.key, submission.task_id)
+            return
+        if submission.tracks:
+            self._update(genre, status="done", task_id=submission.task_id, submission_key=submission.key,
+                         tracks=submission.tracks, submitted_at=submission.submitted_at,
+                         finished_at=time.time())
+            return
+        self._update(genre, status="rendering", task_id=submission.task_id, submission_key=submission.key,
+                     api_key=submission.api_key, submitted_at=submission.submitted_at, shared=submission.shared)
+
+    def _render_key(self, genre: str) -> tuple:
+        return render_key(self.profile.suno_model, self.instrumental, self.variants[genre]["lyrics"])
+
+    def _schedule(self, genre: str) -> None:
+        """Legt die nächste Abfrage eines Renders nach der Laufzeitstatistik fest"""
+        elapsed = time.time() - self.variants[genre]["submitted_at"]
+        estimate = self._eta.estimate("render", self._render_key(genre))
+        self._next_poll[genre] = time.time() + self.profile.poll_interval(elapsed, estimate)
+
+    def _poll(self, genre: str) -> None:
+        try:
+            self._poll_variant(genre)
+        except Exception as e:
+            self._abort(genre, e)
+
+    def _poll_variant(self, genre: str) -> None:
+        variant = self.variants[genre]
+        try:
+            self._deadline.check("Rendern")
+        except DeadlineExceeded as e:
+            self._submissions.discard(variant["submission_key"], variant["task_id"])
+            self._update(genre, status="failed", error=str(e), finished_at=time.time())
+            return
+        try:
+            finished, failed, tracks = is_generation_complete(
+                get_task_info(variant["task_id"], variant["api_key"], deadline=self._deadline)
+            )
+        except CircuitOpen:
+            return
+        except RuntimeError as e:
+            self._accounts.record(variant["api_key"], ok=False)
+            errors = variant["errors"] + 1
+            if errors >= MAX_POLL_ERRORS:
+                self._submissions.discard(variant["submission_key"], variant["task_id"])
+                self._update(genre, status="failed", error=str(e), errors=errors,
+                             finished_at=time.time())
+            else:
+                self._set(genre, errors=errors)
+            return
+        self._accounts.record(variant["api_key"], ok=True)
+        self._set(genre, errors=0)
+        if failed or (finished and not tracks):
+            self._submissions.discard(variant["submission_key"], variant["task_id"])
+            self._update(genre, status="failed", error="Generierung fehlgeschlagen",
+                         finished_at=time.time())
+        elif finished:
+            self._submissions.complete(variant["submission_key"], variant["task_id"], tracks)
+            if not variant["shared"]:
+                self._eta.record("render", self._render_key(genre), time.time() - variant["submitted_at"])
+            self._update(genre, status="done", tracks=tracks, finished_at=time.time())
+
+    def _poll_loop(self) -> None:
+        # Fällige Renders werden in einer gemeinsamen Runde abgefragt
+        try:
+            while not self.done:
+                # Spätestens nach poll_delay werden neu zugelassene Varianten abgesendet
+                now = time.time()
+                wake = min(self._next_poll.values(), default=now + self.profile.poll_delay)
+                time.sleep(min(max(wake - now, 0), self.profile.poll_delay))
+                self._start_admitted()
+                now = time.time()
+                due = []
+                for genre, variant in self.variants.items():
+                    if variant["status"] != "rendering":
+                        self._next_poll.pop(genre, None)
+                    elif genre not in self._next_poll:
+                        self._schedule(genre)
+                    elif self._next_poll[genre] <= now:
+                        due.append(genre)
+                list(self._pool.map(self._poll, due))
+                for genre in due:
+                    if self.variants[genre]["status"] == "rendering":
+                        self._schedule(genre)
+        except Exception as e:
+            # Ohne Abfragerunde käme keine Variante mehr zum Ende
+            self._abort_open(e)
+        finally:
+            self._pool.shutdown(wait=False)
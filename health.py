@@ -0,0 +1,129 @@
+"""
+Verfügbarkeit der externen Dienste für den KI Song-Agent
+Ein CircuitBreaker pro Dienst zählt Fehlschläge in Folge und öffnet nach
+FAILURE_THRESHOLD Fehlern: weitere Aufrufe scheitern dann sofort, statt
+Threads und Sockets bis zum Timeout zu binden. Nach RESET_TIMEOUT darf ein
+einzelner Testaufruf durch; endet er ohne verwertbares Ergebnis, gibt
+release_trial() den Platz für den nächsten frei. Der HealthMonitor prüft die Dienste zusätzlich
+im Hintergrund und schließt bzw. öffnet die Breaker anhand der Ergebnisse.
+"""
+
+import threading
+import time
+from typing import Callable
+
+FAILURE_THRESHOLD = 3                    # Fehler in Folge bis der Breaker öffnet
+RESET_TIMEOUT     = 30                   # Sekunden bis zum nächsten Testaufruf
+PROBE_INTERVAL    = 15                   # Sekunden zwischen zwei Prüfungen
+
+
+class CircuitOpen(RuntimeError):
+    """Der Dienst gilt als gestört; der Aufruf wurde gar nicht erst versucht"""
+
+
+class CircuitBreaker:
+    """closed → open nach wiederholten Fehlern → half_open für einen Testaufruf → closed"""
+
+    def __init__(self, name: str, failure_threshold: int = FAILURE_THRESHOLD,
+                 reset_timeout: float = RESET_TIMEOUT):
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial: int | None = None   # Thread des laufenden Testaufrufs im Zustand half_open
+        self.last_error: str | None = None
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == "open" and time.time() - self._opened_at >= self._reset_timeout:
+                return "half_open"
+            return self._state
+
+    def allow(self) -> bool:
+        """True, wenn ein Aufruf versucht werden darf"""
+        with self._lock:
+            if self._state == "closed":
+                return True
+            if time.time() - self._opened_at < self._reset_timeout or self._trial is not None:
+                return False
+            self._state, self._trial = "half_open", threading.get_ident()
+            return True
+
+    def check(self) -> None:
+        """Wirft CircuitOpen, wenn kein Aufruf versucht werden darf"""
+        if not self.allow():
+            raise CircuitOpen(f"{self.name} ist derzeit nicht erreichbar: {self.last_error}")
+
+    def release_trial(self) -> None:
+        """Gibt den Testaufruf des aufrufenden Threads frei, falls er ohne Ergebnis endete
+
+        Für finally-Blöcke: nach record_success/record_failure ist nichts mehr freizugeben.
+        """
+        with self._lock:
+            if self._trial == threading.get_ident():
+                self._trial = None
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state, self._failures, self._trial = "closed", 0, None
+            self.last_error = None
+
+    def record_failure(self, error) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial = None
+            self.last_error = str(error)
+            if self._state == "half_open" or self._failures >= self._failure_threshold:
+                self._state, self._opened_at = "open", time.time()
+
+
+class HealthMonitor:
+    """Prüft die Dienste regelmäßig im Hintergrund und führt die Ergebnisse in den Breakern nach"""
+
+    def __init__(self, probes: dict[str, tuple[Callable[[], None], CircuitBreaker]],
+                 interval: float = PROBE_INTERVAL):
+        """probes: Dienstname → (Prüffunktion, die bei Störung RuntimeError wirft, Breaker)"""
+        self._probes = probes
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._results: dict[str, dict] = {
+            name: {"ok": None, "latency": None, "error": None, "checked_at": None} for name in probes
+        }
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def probe_all(self) -> None:
+        for name, (probe, breaker) in self._probes.items():
+            started = time.time()
+            try:
+                probe()
+            except RuntimeError as e:
+                breaker.record_failure(e)
+                result = {"ok": False, "latency": None, "error": str(e)}
+            else:
+                breaker.record_success()
+                result = {"ok": True, "latency": time.time() - started, "error": None}
+            with self._lock:
+                self._results[name] = {**result, "checked_at": time.time()}
+
+    def snapshot(self) -> dict[str, dict]:
+        """Letztes Prüfergebnis und Breaker-Zustand pro Dienst"""
+        with self._lock:
+            results = {name: dict(result) for name, result in self._results.items()}
+        for name, (_, breaker) in self._probes.items():
+            results[name]["state"] = breaker.state
+        return results
+
+    def _run(self) -> None:
+        while True:
+            self.probe_all()
+            time.sleep(self._interval)
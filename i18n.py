@@ -0,0 +1,90 @@
+"""
+Übersetzungskatalog für den KI Song-Agent
+Die Texte liegen pro Sprache in locales/<lang>.json und werden erst geladen,
+wenn die Sprache tatsächlich verwendet wird. Platzhalter wie {genre} werden
+beim Laden einmal zerlegt, sodass beim Rendern nur noch Teile verbunden werden.
+"""
+
+import json
+import os
+import threading
+from string import Formatter
+
+LOCALES_DIR       = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locales")
+FALLBACK_LANGUAGE = "en"
+
+
+class Template:
+    """Vorab zerlegter Text mit Platzhaltern"""
+
+    __slots__ = ("raw", "parts")
+
+    def __init__(self, raw: str, parts: tuple[tuple[str, str | None, str], ...]):
+        self.raw = raw
+        self.parts = parts               # (Literal, Feldname, Format-Spezifikation)
+
+    def render(self, values: dict) -> str:
+        out = []
+        for literal, field, spec in self.parts:
+            out.append(literal)
+            if field is not None:
+                out.append(format(values[field], spec))
+        return "".join(out)
+
+
+def compile_text(value):
+    """Zerlegt Texte mit Platzhaltern in ein Template, andere Werte bleiben unverändert"""
+    if not isinstance(value, str) or "{" not in value:
+        return value
+    parts = []
+    for literal, field, spec, conversion in Formatter().parse(value):
+        if conversion or (field is not None and not field.isidentifier()):
+            return value                 # Sonderfälle übernimmt str.format
+        parts.append((literal, field, spec or ""))
+    return Template(value, tuple(parts))
+
+
+class I18nCatalog:
+    """Prozessweiter Übersetzungskatalog mit Fallback-Kette Sprache → Basissprache → Englisch → Schlüssel"""
+
+    def __init__(self, directory: str = LOCALES_DIR, fallback: str = FALLBACK_LANGUAGE):
+        self._directory = directory
+        self._fallback = fallback
+        self._lock = threading.Lock()
+        self._catalogs: dict[str, dict] = {}
+        self._chains: dict[str, tuple[dict, ...]] = {}
+
+    def _load(self, lang: str) -> dict:
+        catalog = self._catalogs.get(lang)
+        if catalog is not None:
+            return catalog
+        with self._lock:
+            if lang not in self._catalogs:
+                path = os.path.join(self._directory, f"{lang}.json")
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        texts = json.load(f)
+                except FileNotFoundError:
+                    texts = {}
+                self._catalogs[lang] = {key: compile_text(value) for key, value in texts.items()}
+            return self._catalogs[lang]
+
+    def _chain(self, lang: str) -> tuple[dict, ...]:
+        chain = self._chains.get(lang)
+        if chain is None:
+            languages = dict.fromkeys((lang, lang.split("-")[0], self._fallback))
+            chain = self._chains[lang] = tuple(self._load(code) for code in languages)
+        return chain
+
+    def text(self, lang: str, key: str, **kwargs):
+        for catalog in self._chain(lang):
+            value = catalog.get(key)
+            if value is not None:
+                break
+        else:
+            return key
+        if isinstance(value, Template):
+            return value.render(kwargs) if kwargs else value.raw
+        if kwargs and isinstance(value, str):
+            return value.format(**kwargs)
+        return value
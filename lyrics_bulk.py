@@ -0,0 +1,169 @@
+"""
+Lyrics-Massenverarbeitung für den KI Song-Agent
+Schickt viele Prompts ohne Suno (und ohne Credits) durch Ollama, z.B. für
+Reviews oder A/B-Tests von Prompts. Ergebnisse werden sofort als JSONL
+geschrieben, daher bleibt der Speicherverbrauch konstant. Die Ausgabedatei
+dient gleichzeitig als Checkpoint: bereits erfolgreiche IDs werden beim
+erneuten Start übersprungen, fehlgeschlagene erneut versucht. Pro ID gilt
+die letzte Zeile; beim Start und am Ende wird die Datei auf eine Zeile pro
+ID verdichtet.
+
+Aufruf: python main.py lyrics prompts.jsonl --out lyrics.jsonl --concurrency 4
+Spalten: description, genre (optional: id, custom_style, profile, weitere werden durchgereicht)
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from batch_cli import emit, read_rows, row_id
+from genre_catalog import default_catalog
+from lyrics_generator import generate_lyrics_with_ollama
+from profiles import DEFAULT_PROFILE, PROFILES
+
+def compact_results(path: str) -> dict[str, str | None]:
+    """Status des letzten Ergebnisses pro ID; die Datei wird neu geschrieben, wenn sie Doppelte oder kaputte Zeilen enthält
+
+    Im Speicher liegt nur Status und Dateiposition pro ID, die Zeilen selbst werden beim Neuschreiben gestreamt.
+    """
+    latest: dict[str, tuple[str | None, int]] = {}
+    if not os.path.exists(path):
+        return {}
+    lines = offset = 0
+    with open(path, 'rb') as f:
+        for line in f:
+            lines += 1
+            try:
+                record = json.loads(line)
+                latest[str(record["id"])] = (record.get("status"), offset)   # spätere Zeilen ersetzen frühere
+            except (ValueError, KeyError, TypeError):
+                pass                     # abgebrochene letzte Zeile nach einem Absturz
+            offset += len(line)
+    if lines != len(latest):
+        keep = {position for _, position in latest.values()}
+        tmp_path = f"{path}.tmp"
+        with open(path, 'rb') as src, open(tmp_path, 'wb') as dst:
+            offset = 0
+            for line in src:
+                if offset in keep:
+                    dst.write(line if line.endswith(b"\n") else line + b"\n")
+                offset += len(line)
+        os.replace(tmp_path, path)
+    return {record_id: status for record_id, (status, _) in latest.items()}
+
+def load_checkpoint(path: str) -> set[str]:
+    """IDs aller bereits erfolgreich geschriebenen Ergebnisse, nach dem Verdichten der Datei"""
+    return {record_id for record_id, status in compact_results(path).items() if status == "ok"}
+
+def generate_record(row_id: str, row: dict, lang: str, profile: str = DEFAULT_PROFILE) -> dict:
+    """Generiert die Lyrics für eine Zeile; Fehler landen im Ergebnis statt als Exception"""
+    description = (row.get("description") or "").strip()
+    genre = (row.get("genre") or "").strip()
+    custom_style = (row.get("custom_style") or "").strip()
+    profile = (row.get("profile") or "").strip() or profile
+    record = {"id": row_id, "genre": genre, "description": description, "profile": profile, "input": row}
+    catalog = default_catalog()
+    started = time.time()
+    try:
+        if not description:
+            raise RuntimeError("description fehlt")
+        if genre not in catalog:
+            raise RuntimeError(f"Unbekanntes Genre: {genre!r}")
+        if profile not in PROFILES:
+            raise RuntimeError(f"Unbekanntes Profil: {profile!r}")
+        style = catalog.style_description(genre, custom_style, lang)
+        lyrics, _ = generate_lyrics_with_ollama(description, genre, style, catalog.prompt_context(genre),
+                                                **PROFILES[profile].lyrics_options())
+        if not lyrics:
+            raise RuntimeError("Keine Songtexte generiert")
+        record.update(status="ok", style=style, lyrics=lyrics)
+    except RuntimeError as e:
+        record.update(status="failed", error=str(e))
+    record["elapsed"] = round(time.time() - started, 3)
+    return record
+
+def percentile(values: list[float], pct: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * pct))], 3)
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="main.py lyrics", description="Nur Songtexte im Bulk generieren")
+    parser.add_argument("input", help="CSV- oder JSONL-Datei mit description, genre")
+    parser.add_argument("--out", default="lyrics.jsonl", help="JSONL-Ausgabe und Checkpoint (Standard: lyrics.jsonl)")
+    parser.add_argument("--lang", default="en", choices=("en", "de"), help="Sprache der Stilbeschreibung")
+    parser.add_argument("--concurrency", type=int, default=2, help="parallele Ollama-Aufrufe")
+    parser.add_argument("--profile", default=DEFAULT_PROFILE, choices=tuple(PROFILES),
+                        help=f"Generierungsprofil für Zeilen ohne eigene Spalte profile (Standard: {DEFAULT_PROFILE})")
+    return parser
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    done_ids = load_checkpoint(args.out)
+    errors: Counter = Counter()
+    latencies: list[float] = []
+    counts = {"ok": 0, "failed": 0, "skipped": 0}
+    started = time.time()
+    interrupted = False
+
+    def write(out, record: dict) -> None:
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        out.flush()
+        counts[record["status"]] += 1
+        latencies.append(record["elapsed"])
+        if record["status"] == "failed":
+            errors[record["error"].split(":")[0]] += 1
+            emit("failed", id=record["id"], error=record["error"])
+        else:
+            emit("lyrics_done", id=record["id"], elapsed=record["elapsed"])
+
+    pool = ThreadPoolExecutor(max_workers=args.concurrency)
+    in_flight = set()
+    with open(args.out, 'a', encoding='utf-8') as out:
+        try:
+            for index, row in enumerate(read_rows(args.input), start=1):
+                record_id = row_id(row, index)
+                if record_id in done_ids:
+                    counts["skipped"] += 1
+                    continue
+                # Höchstens doppelt so viele Aufträge wie Worker vorhalten
+                if len(in_flight) >= args.concurrency * 2:
+                    finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        write(out, future.result())
+                in_flight.add(pool.submit(generate_record, record_id, row, args.lang, args.profile))
+            while in_flight:
+                finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    write(out, future.result())
+        except KeyboardInterrupt:
+            interrupted = True
+        finally:
+            pool.shutdown(wait=not interrupted, cancel_futures=True)
+    # Erneut versuchte IDs stehen jetzt doppelt in der Datei; nur die neue Zeile bleibt
+    compact_results(args.out)
+
+    elapsed = time.time() - started
+    processed = counts["ok"] + counts["failed"]
+    emit(
+        "finished",
+        interrupted=interrupted,
+        **counts,
+        elapsed=round(elapsed, 1),
+        per_minute=round(processed / elapsed * 60, 1) if elapsed > 0 else None,
+        latency_p50=percentile(latencies, 0.5),
+        latency_p95=percentile(latencies, 0.95),
+        errors=dict(errors),
+        output=args.out
+    )
+    if interrupted:
+        return 130
+    return 1 if counts["failed"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,247 @@
+"""
+Lyrics-Generierung für den KI Song-Agent
+Ollama-Anbindung ohne Streamlit-Abhängigkeit, damit sie auch aus
+Hintergrund-Threads heraus genutzt werden kann
+"""
+
+import json
+import re
+import threading
+from datetime import datetime
+
+import requests
+
+from deadline import Deadline, DeadlineExceeded, bounded
+from health import CircuitBreaker
+
+OLLAMA_URL     = "http://localhost:11434"  # Ollama Server URL
+OLLAMA_MODEL   = "gemma3n:e4b"             # Ollama Model
+OLLAMA_TIMEOUT = 120                       # Sekunden
+MAX_LYRICS_LEN = 5000                      # Zeichen
+OLLAMA_NUM_PREDICT = 2000                  # maximale Tokens der Antwort
+CANDIDATE_RESERVE  = 600                   # Sekunden der Frist, die weitere Entwürfe für Suno übrig lassen
+PROBE_TIMEOUT  = 5                         # Sekunden für die Erreichbarkeitsprüfung
+
+OLLAMA_BREAKER = CircuitBreaker("Ollama")
+
+
+class LyricsCancelled(Exception):
+    """Die Generierung wurde abgebrochen, weil der Entwurf überholt ist"""
+
+
+def clean_lyrics_output(raw_output: str) -> str:
+    """
+    Bereinigt die Ausgabe von Ollama und entfernt unerwünschte Erklärungen
+    """
+    # Entferne häufige Einleitungsphrasen
+    unwanted_phrases = [
+        r"Okay,?\s*hier ist ein.*?:",
+        r"Hier ist ein.*?:",
+        r"Ich habe.*?erstellt:",
+        r"Der folgende.*?:",
+        r"Basierend auf.*?:",
+        r"Hier sind die.*?:",
+        r".*?im\s+\w+\s+Stil.*?:",
+        r".*?passend zu.*?:",
+        r".*?entsprechend.*?:",
+        r".*?Genre.*?:",
+        r".*?Songtext.*?:",
+        r".*?Lyrics.*?:",
+        r".*?Text.*?:",
+    ]
+    
+    cleaned = raw_output.strip()
+    
+    # Entferne Einleitungsphrasen am Anfang
+    for phrase in unwanted_phrases:
+        cleaned = re.sub(phrase, "", cleaned, flags=re.IGNORECASE | re.MULTILINE)
+    
+    # Entferne leere Zeilen am Anfang
+    cleaned = cleaned.lstrip('\n\r ')
+    
+    # Finde den ersten Song-Abschnitt (Verse, Chorus, etc.)
+    song_sections = [r'\[Verse', r'\[Chorus', r'\[Pre-Chorus', r'\[Bridge', r'\[Intro', r'\[Outro']
+    
+    for section in song_sections:
+        match = re.search(section, cleaned, re.IGNORECASE)
+        if match:
+            # Beginne ab dem ersten gefundenen Song-Abschnitt
+            cleaned = cleaned[match.start():]
+            break
+    
+    return cleaned.strip()
+
+def build_lyrics_prompt(song_description: str, genre: str, style_description: str,
+                        genre_info: dict | None = None) -> str:
+    """Baut den Ollama-Prompt für Songtexte im korrekten Format"""
+    genre_context = ""
+    if genre != "Custom":
+        genre_info = genre_info or {}
+        genre_context = f"""
+GENRE-KONTEXT ({genre}):
+- Tempo: {genre_info.get('tempo', 'Variable')}
+- Typische Stimmung: {genre_info.get('mood', 'Variable')}
+- Charakteristika: {genre_info.get('description', 'Variable')}
+"""
+
+    return f"""Du bist ein professioneller Songwriter. Schreibe AUSSCHLIESSLICH Songtexte im korrekten Format.
+
+SONG-BESCHREIBUNG: "{song_description}"
+{genre_context}
+STIL: {style_description}
+
+WICHTIGE REGELN:
+- Gib NUR den Songtext aus, KEINE Erklärungen oder Kommentare
+- Beginne DIREKT mit [Verse 1] oder [Intro]
+- Verwende AUSSCHLIESSLICH diese Struktur:
+
+[Verse 1]
+...
+
+[Pre-Chorus]
+...
+
+[Chorus]
+...
+
+[Verse 2]
+...
+
+[Pre-Chorus]
+...
+
+[Chorus]
+...
+
+[Bridge]
+...
+
+[Final Chorus]
+...
+
+- Maximal 5000 Zeichen
+- Inhalt muss zum Genre "{genre}" passen
+- KEINE Einleitungen wie "Hier ist ein Songtext..." oder ähnliches
+- STARTE SOFORT mit dem ersten Song-Abschnitt
+
+Generiere jetzt den Songtext:"""
+
+def _read_stream(response: requests.Response, cancel_event: threading.Event,
+                 deadline: Deadline | None = None) -> str:
+    """Liest eine gestreamte Ollama-Antwort und bricht bei cancel_event oder abgelaufener Frist ab"""
+    parts = []
+    for line in response.iter_lines():
+        if cancel_event.is_set():
+            raise LyricsCancelled()
+        if deadline is not None and deadline.expired:
+            raise DeadlineExceeded("Frist abgelaufen während: Songtexte")
+        if not line:
+            continue
+        chunk = json.loads(line)
+        parts.append(chunk.get("response", ""))
+        if chunk.get("done"):
+            break
+    return "".join(parts)
+
+def ping_ollama() -> None:
+    """Erreichbarkeitsprüfung für den HealthMonitor; RuntimeError, wenn Ollama nicht antwortet"""
+    try:
+        requests.get(f"{OLLAMA_URL}/api/tags", timeout=PROBE_TIMEOUT).raise_for_status()
+    except requests.exceptions.RequestException as e:
+        raise RuntimeError(f"Ollama-Fehler: {e}")
+
+def score_lyrics(lyrics: str) -> tuple[int, int]:
+    """Bewertet einen Entwurf: verschiedene Song-Abschnitte, dann Länge"""
+    sections = {section.lower() for section in re.findall(r"^\[([^\]]+)\]", lyrics, re.MULTILINE)}
+    return len(sections), len(lyrics)
+
+def _request_lyrics(prompt: str, model: str, num_predict: int,
+                    cancel_event: threading.Event | None, deadline: Deadline | None) -> str:
+    """Ein Ollama-Aufruf; liefert die bereinigten, gekürzten Songtexte"""
+    timeout = bounded(OLLAMA_TIMEOUT, deadline, "Songtexte")
+    OLLAMA_BREAKER.check()
+    payload = {
+        "model": model,
+        "prompt": prompt,
+        "stream": cancel_event is not None,
+        "options": {
+            "temperature": 0.8,
+            "top_p": 0.9,
+            "num_predict": num_predict
+        }
+    }
+
+    try:
+        with requests.post(
+            f"{OLLAMA_URL}/api/generate",
+            json=payload,
+            timeout=timeout,
+            stream=cancel_event is not None
+        ) as response:
+            # Ollama hat geantwortet; Abbrüche und Modellfehler sagen nichts über die Erreichbarkeit
+            OLLAMA_BREAKER.record_success()
+            response.raise_for_status()
+            if cancel_event is not None:
+                raw_output = _read_stream(response, cancel_event, deadline)
+            else:
+                raw_output = response.json().get("response", "")
+    except requests.exceptions.RequestException as e:
+        # Ein Timeout, der nur durch die knappe Frist entstand, spricht nicht gegen Ollama
+        if not isinstance(e, requests.exceptions.HTTPError) and timeout == OLLAMA_TIMEOUT:
+            OLLAMA_BREAKER.record_failure(e)
+        raise RuntimeError(f"Ollama-Fehler: {e}")
+    except ValueError as e:
+        raise RuntimeError(f"Ollama-Fehler: {e}")
+    finally:
+        # Endet ein Testaufruf ohne gezähltes Ergebnis, bekommt der nächste Aufruf die Chance
+        OLLAMA_BREAKER.release_trial()
+
+    # Bereinige die Ausgabe von unerwünschten Erklärungen und begrenze auf 5000 Zeichen
+    return clean_lyrics_output(raw_output)[:MAX_LYRICS_LEN]
+
+def generate_lyrics_with_ollama(song_description: str, genre: str, style_description: str,
+                                genre_info: dict | None = None,
+                                cancel_event: threading.Event | None = None,
+                                deadline: Deadline | None = None,
+                                model: str = OLLAMA_MODEL, num_predict: int = OLLAMA_NUM_PREDICT,
+                                candidates: int = 1) -> tuple[str, str]:
+    """
+    Generiert Songtexte mit Ollama basierend auf Genre und Stilbeschreibung
+    Mit cancel_event wird die Antwort gestreamt und kann abgebrochen werden.
+    Mit deadline wird der Timeout auf die verbleibende Zeit des Auftrags begrenzt.
+    Bei candidates > 1 entstehen weitere Entwürfe, solange die Frist dafür reicht;
+    zurückgegeben wird der mit den meisten Song-Abschnitten.
+    Returns: (lyrics, style_description)
+    Raises: RuntimeError bei Ollama-Fehlern (CircuitOpen ohne Versuch, solange Ollama
+            als gestört gilt; DeadlineExceeded nach Ablauf der Frist), LyricsCancelled bei Abbruch
+    """
+    prompt = build_lyrics_prompt(song_description, genre, style_description, genre_info)
+    best = _request_lyrics(prompt, model, num_predict, cancel_event, deadline)
+    for _ in range(candidates - 1):
+        # Weitere Entwürfe sind optional und dürfen die Zeit fürs Rendern nicht aufbrauchen
+        budget = None if deadline is None else Deadline(deadline.remaining() - CANDIDATE_RESERVE)
+        try:
+            lyrics = _request_lyrics(prompt, model, num_predict, cancel_event, budget)
+        except RuntimeError:
+            break
+        if score_lyrics(lyrics) > score_lyrics(best):
+            best = lyrics
+    return best, style_description
+
+def build_lyrics_document(track_info: dict, genre: str, style: str, lyrics: str) -> str:
+    """Erstellt die Lyrics-Textdatei mit Metadaten"""
+    return f"""Song Title: {track_info.get('title', 'AI Generated Song')}
+Genre: {genre}
+Style: {style}
+Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Duration: {track_info.get('duration', 'N/A')} seconds
+Model: {track_info.get('model_name', 'V4_5')}
+
+--- LYRICS ---
+
+{lyrics}
+
+--- END ---
+
+Generated by AI Song Agent
+"""
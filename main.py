@@ -1,7 +1,18 @@
 import subprocess
 import os
+import sys
 
 def main():
+    # 'python main.py batch songs.csv ...' läuft headless ohne Streamlit
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        from batch_cli import main as batch_main
+        sys.exit(batch_main(sys.argv[2:]))
+
+    # 'python main.py lyrics prompts.jsonl ...' generiert nur Songtexte
+    if len(sys.argv) > 1 and sys.argv[1] == "lyrics":
+        from lyrics_bulk import main as lyrics_main
+        sys.exit(lyrics_main(sys.argv[2:]))
+
     script_path = os.path.join(os.path.dirname(__file__), "song_agent.py")
     # Use 'python' instead of 'python3' for better compatibility on Windows systems.
     # If you still encounter 'Python not found' errors, ensure Python is installed
@@ -10,5 +21,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
-
@@ -0,0 +1,69 @@
+"""
+Generierungsprofile für den KI Song-Agent
+Ein Profil bündelt alles, was Dauer und Qualität eines Songs bestimmt:
+Suno-Modell, Ollama-Modell und Länge der Antwort, Zahl der Lyrics-Entwürfe
+und die Abfragefrequenz während des Renderns. Schnelle Entwürfe zahlen so
+nicht die Wartezeit der aufwändigsten Einstellungen.
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from eta_model import Estimate
+from lyrics_generator import OLLAMA_MODEL, OLLAMA_NUM_PREDICT
+from suno_client import POLL_DELAY, SUNO_MODEL
+
+EARLY_MAX_GAP = 30                       # längste Pause vor dem erwarteten Fertigstellungsfenster
+
+
+@dataclass(frozen=True, slots=True)
+class GenerationProfile:
+    name: str
+    suno_model: str
+    ollama_model: str
+    num_predict: int                     # maximale Tokens der Lyrics-Antwort
+    candidates: int                      # Lyrics-Entwürfe, der vollständigste wird gerendert
+    poll_delay: float                    # Abfragetakt im erwarteten Fertigstellungsfenster
+    poll_delay_max: float                # obere Grenze, wenn die Pause nach dem Fenster wächst
+    poll_backoff: float = 1.0            # Faktor pro poll_delay nach dem Fenster, 1.0 = feste Pause
+
+    def lyrics_options(self) -> dict:
+        """Argumente für generate_lyrics_with_ollama"""
+        return {"model": self.ollama_model, "num_predict": self.num_predict, "candidates": self.candidates}
+
+    def poll_interval(self, elapsed: float, estimate: Estimate) -> float:
+        """
+        Pause bis zur nächsten Abfrage, elapsed Sekunden nach dem Absenden.
+        Vor dem Fenster der Laufzeitschätzung selten, darin im Takt poll_delay,
+        danach wachsend mit poll_backoff bis poll_delay_max.
+        """
+        start, end = estimate.window()
+        if elapsed < start:
+            return min(max(start - elapsed, self.poll_delay), EARLY_MAX_GAP)
+        if elapsed <= end:
+            return self.poll_delay
+        late = (elapsed - end) / self.poll_delay
+        return min(self.poll_delay * self.poll_backoff ** late, self.poll_delay_max)
+
+
+PROFILES = MappingProxyType({profile.name: profile for profile in (
+    # Schnelle Iteration: kleineres Modell, kurze Antwort, häufige Abfragen
+    GenerationProfile("draft", suno_model="V4", ollama_model="gemma3n:e2b", num_predict=1200,
+                      candidates=1, poll_delay=2, poll_delay_max=2),
+    # Bisheriges Verhalten
+    GenerationProfile("standard", suno_model=SUNO_MODEL, ollama_model=OLLAMA_MODEL,
+                      num_predict=OLLAMA_NUM_PREDICT, candidates=1,
+                      poll_delay=POLL_DELAY, poll_delay_max=POLL_DELAY),
+    # Endfassung: zwei Entwürfe, neuestes Modell; die Renderzeit ist länger, also seltener abfragen
+    GenerationProfile("final", suno_model="V4_5PLUS", ollama_model=OLLAMA_MODEL, num_predict=3000,
+                      candidates=2, poll_delay=POLL_DELAY, poll_delay_max=15, poll_backoff=1.3),
+)})
+DEFAULT_PROFILE = "standard"
+
+
+def get_profile(name: str | None = None) -> GenerationProfile:
+    """Profil nach Name; ValueError bei unbekannten Namen"""
+    try:
+        return PROFILES[name or DEFAULT_PROFILE]
+    except KeyError:
+        raise ValueError(f"Unbekanntes Profil: {name!r} (verfügbar: {', '.join(PROFILES)})") from None
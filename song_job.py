@@ -0,0 +1,249 @@
+"""
+Hintergrund-Job für einen einzelnen Song im KI Song-Agent
+Lyrics → Suno-Auftrag → Polling laufen in einem eigenen Thread. Die
+Oberfläche liest nur noch Momentaufnahmen des Zustands und muss dafür
+weder warten noch das Skript blockieren.
+"""
+
+import threading
+import time
+
+from lyrics_generator import OLLAMA_TIMEOUT, generate_lyrics_with_ollama
+from suno_client import (
+    build_song_payload,
+    early_stream_url,
+    get_task_info,
+    is_generation_complete,
+    track_audio_url
+)
+from account_pool import AccountPool, ensure_pool
+from admission import AdmissionController, default_admission
+from deadline import JOB_DEADLINE, Deadline, DeadlineExceeded, bounded
+from eta_model import EtaModel, default_eta_model, render_key
+from health import CircuitOpen
+from profiles import GenerationProfile, get_profile
+from submission_cache import SubmissionCache, default_submissions
+
+MAX_POLL_ERRORS = 5                      # Verbindungsfehler in Folge bis zum Abbruch
+
+
+class SongJob:
+    """Erzeugt einen Song im Hintergrund; Fehler werden als Übersetzungsschlüssel abgelegt"""
+
+    TERMINAL = ("done", "failed")
+
+    def __init__(self, accounts: AccountPool | str, song_description: str, genre: str, style: str,
+                 instrumental: bool = False, genre_info: dict | None = None, speculative=None,
+                 submissions: SubmissionCache | None = None, fresh: bool = False,
+                 admission: AdmissionController | None = None, owner: str = "default",
+                 deadline: float = JOB_DEADLINE, profile: GenerationProfile | None = None,
+                 eta_model: EtaModel | None = None):
+        self._accounts = ensure_pool(accounts)
+        self._admission = admission or default_admission()
+        self._owner = owner              # Nutzer bzw. Session für die faire Warteschlange
+        self._poll_key = None            # Konto, das den Auftrag angenommen hat
+        self._submissions = submissions or default_submissions()
+        self._fresh = fresh              # gespeicherte Ergebnisse gleicher Aufträge nicht wiederverwenden
+        self._submission_key = None
+        self._genre_info = genre_info or {}
+        self._speculative = speculative  # SpeculativeLyrics, deren passender Entwurf übernommen wird
+        self._budget = deadline          # Sekunden ab start() für alle Stufen zusammen
+        self._profile = profile or get_profile()
+        self._eta = eta_model or default_eta_model()
+        self._measured = False           # eigener Render, dessen Dauern in die Statistik eingehen
+        self._deadline: Deadline | None = None
+        self._lock = threading.Lock()
+        # "stage" ändert sich nur bei Phasenwechseln, "rev" bei jeder Änderung
+        self.state = {
+            "genre": genre, "song_description": song_description, "style": style,
+            "instrumental": instrumental, "status": "queued", "stage": 0, "rev": 0,
+            "lyrics": "", "final_style": "", "adopted": False, "task_id": None,
+            "api_status": None, "tracks": [], "audio_url": None, "stream_url": None,
+            "error_key": None, "error": None, "errors": 0, "queue": None,
+            "started_at": None, "phase_started_at": None, "submitted_at": None, "finished_at": None,
+            "deadline_at": None, "profile": self._profile.name,
+            "eta": None                  # (Median, 90. Perzentil) der laufenden Phase in Sekunden
+        }
+
+    @property
+    def done(self) -> bool:
+        return self.state["status"] in self.TERMINAL
+
+    def snapshot(self) -> dict:
+        """Konsistente Kopie des Zustands für die Anzeige"""
+        with self._lock:
+            return dict(self.state)
+
+    def start(self) -> None:
+        self._deadline = Deadline(self._budget)
+        # Die erste Phase (Warteschlange) beginnt mit dem Start, nicht erst beim ersten Statuswechsel
+        self.state["started_at"] = self.state["phase_started_at"] = time.time()
+        self.state["deadline_at"] = self._deadline.expires_at
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _update(self, **changes) -> None:
+        with self._lock:
+            if "status" in changes and changes["status"] != self.state["status"]:
+                self.state["stage"] += 1
+                self.state["phase_started_at"] = time.time()
+            self.state.update(changes)
+            self.state["rev"] += 1
+
+    def _fail(self, error_key: str, error=None) -> None:
+        self._update(status="failed", error_key=error_key,
+                     error=str(error) if error is not None else None, finished_at=time.time())
+
+    def _run(self) -> None:
+        try:
+            if not self._generate_lyrics():
+                return
+            # Der Suno-Platz bleibt vom Absenden bis zum Ende des Renders belegt
+            with self._admission.slot("suno", self._owner, on_wait=self._queued("suno"),
+                                      deadline=self._deadline):
+                if self._submit():
+                    self._poll_loop()
+        except DeadlineExceeded as e:
+            # Warteplatz und Konto sind beim Verlassen der Blöcke schon freigegeben
+            self._abort("timeout_error", e)
+        except Exception as e:
+            # Unerwartete Antworten dürfen den Job nicht in einem laufenden Status zurücklassen
+            self._abort("unexpected_error", e)
+
+    def _abort(self, error_key: str, error: Exception) -> None:
+        """Gibt den Auftrag im Cache frei und markiert den Job als fehlgeschlagen"""
+        if self._submission_key is not None:
+            self._submissions.discard(self._submission_key, self.state["task_id"])
+        self._fail(error_key, error)
+
+    def _queued(self, upstream: str):
+        def on_wait(ahead: int, eta: float) -> None:
+            self._update(status="queued", queue={"upstream": upstream, "ahead": ahead, "eta": eta})
+        return on_wait
+
+    def _lyrics_key(self) -> tuple:
+        return (self._profile.ollama_model, self._profile.candidates)
+
+    def _render_key(self) -> tuple:
+        state = self.state
+        return render_key(self._profile.suno_model, state["instrumental"], state["lyrics"])
+
+    def _generate_lyrics(self) -> bool:
+        state = self.state
+        adopted = None
+        if self._speculative is not None:
+            # Ein laufender Entwurf wird höchstens so lange abgewartet wie ein eigener Ollama-Aufruf;
+            # danach wird er verworfen und direkt generiert
+            adopted = self._speculative.take((state["song_description"].strip(), state["genre"], state["style"],
+                                              self._profile.name),
+                                             timeout=bounded(OLLAMA_TIMEOUT, self._deadline, "Songtexte"))
+        if adopted:
+            lyrics, final_style = adopted
+        else:
+            try:
+                with self._admission.slot("ollama", self._owner, on_wait=self._queued("ollama"),
+                                          deadline=self._deadline):
+                    self._update(status="lyrics", queue=None,
+                                 eta=self._eta.estimate("lyrics", self._lyrics_key()).eta)
+                    started = time.time()
+                    lyrics, final_style = generate_lyrics_with_ollama(
+                        state["song_description"], state["genre"], state["style"], self._genre_info,
+                        deadline=self._deadline, **self._profile.lyrics_options()
+                    )
+                    self._eta.record("lyrics", self._lyrics_key(), time.time() - started)
+            except DeadlineExceeded:
+                raise
+            except RuntimeError as e:
+                self._fail("lyrics_error", e)
+                return False
+        if not lyrics:
+            self._fail("lyrics_error")
+            return False
+        self._update(lyrics=lyrics, final_style=final_style, adopted=bool(adopted))
+        return True
+
+    def _submit(self) -> bool:
+        state = self.state
+        self._update(status="submitting", queue=None)
+        payload = build_song_payload(state["genre"], state["song_description"], state["lyrics"],
+                                     state["final_style"], state["instrumental"], model=self._profile.suno_model)
+        try:
+            submission = self._submissions.submit(payload, self._accounts, fresh=self._fresh,
+                                                  deadline=self._deadline)
+        except DeadlineExceeded:
+            raise
+        except RuntimeError as e:
+            self._fail("api_error", e)
+            return False
+        if not submission.task_id:
+            self._fail("task_id_error")
+            return False
+        self._submission_key = submission.key
+        self._poll_key = submission.api_key
+        if submission.tracks:
+            # Gleicher Auftrag wurde schon gerendert – Ergebnis ohne neuen Render übernehmen
+            self._finish(submission.task_id, submission.tracks, submitted_at=submission.submitted_at)
+            return False
+        # Angehängte Aufträge misst schon der erste Absender
+        self._measured = not submission.shared
+        self._update(status="rendering", task_id=submission.task_id, submitted_at=submission.submitted_at,
+                     eta=self._eta.estimate("render", self._render_key()).eta)
+        return True
+
+    def _finish(self, task_id: str, tracks: list, **changes) -> None:
+        audio_url = track_audio_url(tracks[0]) if tracks else None
+        if not audio_url:
+            self._submissions.discard(self._submission_key, task_id)
+            self._fail("no_audio_error")
+            return
+        self._update(status="done", task_id=task_id, tracks=tracks, audio_url=audio_url,
+                     finished_at=time.time(), **changes)
+
+    def _poll_interval(self) -> float:
+        """Pause nach der Laufzeitstatistik; bis zur ersten Vorschau zählt auch deren Fenster"""
+        state = self.state
+        elapsed = time.time() - state["submitted_at"]
+        interval = self._profile.poll_interval(elapsed, self._eta.estimate("render", self._render_key()))
+        if not state["stream_url"]:
+            stream = self._eta.estimate("stream", self._render_key())
+            interval = min(interval, self._profile.poll_interval(elapsed, stream))
+        return interval
+
+    def _poll_loop(self) -> None:
+        state = self.state
+        while True:
+            self._deadline.check("Rendern")
+            time.sleep(min(self._poll_interval(), self._deadline.remaining()))
+            try:
+                info = get_task_info(state["task_id"], self._poll_key, deadline=self._deadline)
+                finished, failed, tracks = is_generation_complete(info)
+            except DeadlineExceeded:
+                raise
+            except CircuitOpen:
+                # Suno ist gestört: der Auftrag läuft dort weiter, Abfragen zählen nicht als Fehler
+                continue
+            except RuntimeError as e:
+                self._accounts.record(self._poll_key, ok=False)
+                errors = state["errors"] + 1
+                if errors >= MAX_POLL_ERRORS:
+                    self._submissions.discard(self._submission_key, state["task_id"])
+                    self._fail("connection_errors", e)
+                    return
+                self._update(errors=errors)
+                continue
+            self._accounts.record(self._poll_key, ok=True)
+            if failed:
+                self._submissions.discard(self._submission_key, state["task_id"])
+                self._fail("generation_failed")
+                return
+            if finished:
+                self._submissions.complete(self._submission_key, state["task_id"], tracks)
+                if self._measured:
+                    self._eta.record("render", self._render_key(), time.time() - state["submitted_at"])
+                self._finish(state["task_id"], tracks)
+                return
+            api_status = ((info.get("data") or {}).get("status") or "...").upper()
+            # Ab TEXT_SUCCESS/FIRST_SUCCESS lässt sich der Song schon anhören
+            stream_url = state["stream_url"] or early_stream_url(info)
+            if stream_url and not state["stream_url"] and self._measured:
+                self._eta.record("stream", self._render_key(), time.time() - state["submitted_at"])
+            self._update(api_status=api_status, stream_url=stream_url, errors=0)
@@ -0,0 +1,109 @@
+"""
+Spekulative Lyrics-Vorgenerierung für den KI Song-Agent
+Startet die Songtext-Generierung für den aktuellen Entwurf im Hintergrund,
+bevor der Nutzer absendet. Streamlit meldet den Text eines Eingabefelds erst,
+wenn es den Fokus verliert oder mit Strg+Enter bestätigt wird; jeder gemeldete
+Entwurf startet daher sofort. Überholte Entwürfe werden abgebrochen.
+Entwürfe sind nachrangig: sie belegen nur einen freien Ollama-Platz, um den
+niemand wartet, und entfallen sonst.
+"""
+
+import threading
+from typing import Callable
+
+from admission import AdmissionController, default_admission
+from lyrics_generator import LyricsCancelled, generate_lyrics_with_ollama
+
+
+class _Draft:
+    """Ein Entwurf mit eigenem Abbruch-Signal und Ergebnis"""
+
+    def __init__(self, key: tuple):
+        self.key = key
+        self.status = "pending"            # pending, running, ready, failed, cancelled, skipped
+        self.result: tuple[str, str] | None = None
+        self.error: Exception | None = None
+        self.cancel_event = threading.Event()
+        self.done = threading.Event()
+
+    def cancel(self) -> None:
+        self.cancel_event.set()
+
+
+class SpeculativeLyrics:
+    """Verwaltet genau einen spekulativen Entwurf pro Session"""
+
+    def __init__(self, generate: Callable[..., tuple[str, str]] = generate_lyrics_with_ollama,
+                 admission: AdmissionController | None = None, owner: str = "default"):
+        self._generate = generate
+        self._admission = admission or default_admission()
+        self._owner = owner              # Nutzer bzw. Session, der der Ollama-Platz zugerechnet wird
+        self._lock = threading.Lock()
+        self._draft: _Draft | None = None
+
+    def update(self, key: tuple, *args, **kwargs) -> None:
+        """
+        Meldet den aktuellen Entwurf. key identifiziert das Ergebnis, args und
+        kwargs werden an die Generierungsfunktion weitergereicht. Ein anderer
+        laufender Entwurf wird abgebrochen.
+        """
+        with self._lock:
+            if self._draft is not None and self._draft.key == key:
+                return
+            if self._draft is not None:
+                self._draft.cancel()
+            draft = self._draft = _Draft(key)
+        threading.Thread(target=self._run, args=(draft, args, kwargs), daemon=True).start()
+
+    def cancel(self) -> None:
+        """Verwirft den aktuellen Entwurf"""
+        with self._lock:
+            if self._draft is not None:
+                self._draft.cancel()
+            self._draft = None
+
+    def status(self, key: tuple) -> str | None:
+        """Status des Entwurfs für key, None wenn kein passender Entwurf existiert"""
+        draft = self._draft
+        if draft is None or draft.key != key:
+            return None
+        return draft.status
+
+    def take(self, key: tuple, timeout: float | None = None) -> tuple[str, str] | None:
+        """
+        Übernimmt das Ergebnis für key. Ein noch laufender Entwurf wird
+        abgewartet, da er bereits einen Vorsprung hat. Gibt None zurück,
+        wenn kein passender oder nur ein fehlgeschlagener Entwurf existiert.
+        """
+        with self._lock:
+            draft = self._draft
+            if draft is None or draft.key != key:
+                return None
+            self._draft = None
+        if not draft.done.wait(timeout) or draft.status != "ready":
+            draft.cancel()
+            return None
+        return draft.result
+
+    def _run(self, draft: _Draft, args: tuple, kwargs: dict) -> None:
+        try:
+            if draft.cancel_event.is_set():
+                raise LyricsCancelled()
+            ticket = self._admission.try_enqueue("ollama", self._owner)
+            if ticket is None:
+                # Ollama ist ausgelastet: der Song-Auftrag generiert später selbst in der Warteschlange
+                draft.status = "skipped"
+                return
+            try:
+                draft.status = "running"
+                draft.result = self._generate(*args, cancel_event=draft.cancel_event, **kwargs)
+                draft.status = "ready" if draft.result[0] else "failed"
+            finally:
+                self._admission.release(ticket)
+        except LyricsCancelled:
+            draft.status = "cancelled"
+        except Exception as e:
+            draft.error = e
+            draft.status = "failed"
+        finally:
+            draft.done.set()
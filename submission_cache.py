@@ -0,0 +1,264 @@
+"""
+Suno-Auftragscache für den KI Song-Agent
+Aufträge werden über einen kanonischen Hash ihres Payloads erkannt. Läuft ein
+gleicher Auftrag noch, hängt sich ein neuer Aufruf an dessen Task-ID an; ist
+er fertig, wird das gespeicherte Ergebnis geliefert, solange der Aufrufer
+nicht ausdrücklich neu rendern lässt. Doppelklicks, Wiederholungen nach
+Session-Abbrüchen und gleiche Batch-Zeilen kosten so nur einmal Credits.
+
+Vor dem Senden wird die Absicht als Eintrag festgehalten. Vorübergehende
+Fehler, bei denen Suno den Auftrag sicher nicht angenommen hat, werden mit
+Backoff wiederholt. Bei mehrdeutigen Fehlern (Timeout nach dem Senden,
+abgebrochene Antwort) wird nur dann erneut gesendet, wenn der Credit-Stand
+zeigt, dass kein Auftrag abgerechnet wurde; sonst bleibt der Eintrag als
+"mehrdeutig" stehen und gleiche Aufträge werden bis zum Ablauf nicht erneut
+gesendet.
+
+Gesendet wird über einen AccountPool: jeder Auftrag belegt das gewählte
+Konto, bis er abgeschlossen oder verworfen ist. Bei vorübergehenden Fehlern
+oder leerem Konto wird auf ein anderes Konto ausgewichen.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable
+
+from account_pool import AccountPool, ensure_pool
+from deadline import JOB_DEADLINE, Deadline, DeadlineExceeded
+from suno_client import ApiError, extract_task_id, post_api_request
+
+PAYLOAD_FIELDS = ("model", "customMode", "instrumental", "style", "prompt", "title")
+RESULT_TTL     = 24 * 3600               # fertige Ergebnisse einen Tag lang wiederverwenden
+MAX_ENTRIES    = 500
+SUBMIT_RETRIES = 3                       # zusätzliche Versuche bei gefahrlos wiederholbaren Fehlern
+RETRY_BACKOFF  = 2                       # Sekunden, verdoppelt sich pro Versuch
+
+
+def payload_key(payload: dict) -> str:
+    """Kanonischer Hash der Felder, die das Ergebnis eines Auftrags bestimmen"""
+    canonical = json.dumps({field: payload.get(field) for field in PAYLOAD_FIELDS},
+                           sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class Submission:
+    """Ergebnis von SubmissionCache.submit; tracks ist gesetzt, wenn der Auftrag schon fertig ist"""
+    __slots__ = ("key", "task_id", "api_key", "tracks", "submitted_at", "shared")
+
+    def __init__(self, key: str, task_id: str | None, api_key: str | None = None, tracks: list | None = None,
+                 submitted_at: float | None = None, shared: bool = False):
+        self.key = key
+        self.task_id = task_id
+        self.api_key = api_key                 # Konto, über das der Auftrag abgefragt wird
+        self.tracks = tracks
+        self.submitted_at = submitted_at
+        self.shared = shared                 # an einen bestehenden Auftrag angehängt
+
+
+class _Entry:
+    __slots__ = ("ready", "task_id", "pool", "api_key", "held", "tracks", "error", "ambiguous",
+                 "submitted_at", "finished_at", "expires_at", "refs")
+
+    def __init__(self, pool: AccountPool, deadline: Deadline | None = None):
+        self.ready = threading.Event()       # gesetzt, sobald Task-ID oder Fehler feststehen
+        self.task_id: str | None = None
+        self.pool = pool
+        self.api_key: str | None = None      # Konto, das den Auftrag angenommen hat
+        self.held = False                    # Konto ist belegt, bis der Auftrag abgeschlossen ist
+        self.tracks: list | None = None
+        self.error: str | None = None
+        self.ambiguous = False
+        self.submitted_at: float | None = None
+        self.finished_at: float | None = None
+        self.refs = 1                        # Aufträge, die den laufenden Render noch abfragen
+        # Offene Einträge gelten bis zur spätesten Frist der beteiligten Aufträge
+        self.expires_at = deadline.expires_at if deadline is not None else time.time() + JOB_DEADLINE
+
+
+class AmbiguousSubmission(RuntimeError):
+    """Suno hat den Auftrag womöglich angenommen; er wird nicht automatisch erneut gesendet"""
+
+
+class SubmissionCache:
+    """Prozessweites Register der Suno-Aufträge nach Payload-Hash"""
+
+    def __init__(self, post: Callable[..., dict] = post_api_request,
+                 ttl: float = RESULT_TTL, max_entries: int = MAX_ENTRIES,
+                 retries: int = SUBMIT_RETRIES, backoff: float = RETRY_BACKOFF):
+        self._post = post
+        self._retries = retries
+        self._backoff = backoff
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+
+    def submit(self, payload: dict, accounts: AccountPool | str, fresh: bool = False,
+               deadline: Deadline | None = None) -> Submission:
+        """Sendet den Auftrag oder hängt sich an einen gleichen an; API-Fehler als RuntimeError
+
+        Mit deadline enden Warten, Wiederholungen und Backoff spätestens mit der Frist des Auftrags.
+        """
+        pool = ensure_pool(accounts)
+        key = payload_key(payload)
+        with self._lock:
+            self._expire()
+            entry = self._entries.get(key)
+            # fresh umgeht fertige und mehrdeutige Ergebnisse, laufende Aufträge werden weiter geteilt
+            owner = entry is None or (fresh and (entry.tracks is not None or entry.error is not None))
+            if owner:
+                # Absicht festhalten, bevor gesendet wird
+                entry = self._entries[key] = _Entry(pool, deadline)
+                entry.submitted_at = time.time()
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_entries:
+                    self._release(self._entries.popitem(last=False)[1])
+            elif entry.tracks is None:
+                entry.refs += 1
+                if deadline is not None:
+                    # Angehängte Aufträge fragen denselben Render ab; er darf bis zu ihrer Frist laufen
+                    entry.expires_at = max(entry.expires_at, deadline.expires_at)
+
+        if not owner:
+            if not entry.ready.wait(None if deadline is None else deadline.remaining()):
+                raise DeadlineExceeded("Frist abgelaufen beim Warten auf einen gleichen Auftrag")
+            if entry.error:
+                raise (AmbiguousSubmission if entry.ambiguous else RuntimeError)(entry.error)
+            return Submission(key, entry.task_id, entry.api_key, entry.tracks, entry.submitted_at, shared=True)
+
+        try:
+            response, api_key = self._send(payload, pool, deadline)
+            task_id = extract_task_id(response)
+        except AmbiguousSubmission as e:
+            # Eintrag bleibt stehen, damit gleiche Aufträge nicht doppelt bezahlt werden
+            entry.error = str(e)
+            entry.ambiguous = True
+            entry.ready.set()
+            raise
+        except RuntimeError as e:
+            entry.error = str(e)
+            self._drop(key, entry)
+            entry.ready.set()
+            raise
+        entry.task_id = task_id
+        entry.api_key = api_key
+        entry.held = True
+        entry.submitted_at = time.time()
+        if not task_id:
+            self._drop(key, entry)
+            self._release(entry)
+        entry.ready.set()
+        return Submission(key, task_id, api_key, submitted_at=entry.submitted_at)
+
+    def _send(self, payload: dict, pool: AccountPool, deadline: Deadline | None = None) -> tuple[dict, str]:
+        """Sendet mit Wiederholung und liefert (Antwort, belegter Key)
+
+        Mehrdeutige Fehler werden nur wiederholt, wenn nachweislich nichts abgerechnet wurde.
+        """
+        tried: list[str] = []
+        api_key = pool.acquire(deadline=deadline)
+        # Ein zwischengespeicherter Stand genügt: ist er veraltet, ist er höher als der neue,
+        # und ein mehrdeutiger Fehler wird vorsichtshalber nicht wiederholt
+        credits_before = pool.credits(api_key, deadline=deadline)
+        for attempt in range(self._retries + 1):
+            try:
+                response = self._post("/api/v1/generate", payload, api_key, deadline=deadline)
+            except DeadlineExceeded:
+                # Vor dem Senden abgebrochen: es ist sicher kein Auftrag entstanden
+                pool.release(api_key)
+                raise
+            except ApiError as e:
+                pool.record(api_key, ok=False)
+                if e.credits_exhausted:
+                    pool.mark_exhausted(api_key)
+                retry = attempt < self._retries and (
+                    e.transient or e.credits_exhausted
+                    or (e.ambiguous and self._nothing_charged(pool, api_key, credits_before, deadline))
+                )
+                if not retry:
+                    pool.release(api_key)
+                    if e.ambiguous:
+                        raise AmbiguousSubmission(
+                            f"{e} – der Auftrag wurde möglicherweise angenommen und wird nicht erneut gesendet"
+                        ) from e
+                    raise
+                # Auf ein anderes Konto ausweichen, sofern eines frei ist
+                tried.append(api_key)
+                pool.release(api_key)
+                try:
+                    api_key = pool.acquire(exclude=tried, deadline=deadline)
+                except RuntimeError:
+                    api_key = pool.acquire(deadline=deadline)
+                    delay = self._backoff * 2 ** attempt
+                    time.sleep(delay if deadline is None else min(delay, deadline.remaining()))
+                credits_before = pool.credits(api_key, deadline=deadline)
+                continue
+            pool.record(api_key, ok=True)
+            return response, api_key
+
+    def _nothing_charged(self, pool: AccountPool, api_key: str, credits_before,
+                         deadline: Deadline | None = None) -> bool:
+        # Suno bietet keine Suche nach Aufträgen; ein unveränderter Credit-Stand zeigt, dass keiner angelegt wurde.
+        # Das gilt nur, solange kein anderer Auftrag dieses Kontos den Stand verändert: läuft ein weiterer,
+        # wird nicht wiederholt. Eine Aufladung zwischen beiden Abfragen kann eine Abbuchung verdecken;
+        # das lässt sich über den Credit-Stand nicht erkennen, ebenso wenig Aufträge anderer Programme mit demselben Key.
+        if credits_before is None or pool.in_flight(api_key) != 1:
+            return False
+        return pool.credits(api_key, refresh=True, deadline=deadline) == credits_before
+
+    def complete(self, key: str, task_id: str, tracks: list) -> None:
+        """Speichert das fertige Ergebnis für spätere gleiche Aufträge"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.task_id == task_id and entry.tracks is None:
+                entry.tracks = tracks
+                entry.finished_at = time.time()
+                self._release(entry)
+
+    def discard(self, key: str, task_id: str | None) -> None:
+        """Vergisst einen fehlgeschlagenen Auftrag, damit der nächste Versuch neu sendet
+
+        Solange andere angehängte Aufträge denselben Render noch abfragen, bleibt der Eintrag stehen.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.task_id != task_id:
+                return
+            entry.refs -= 1
+            if entry.refs > 0 and entry.tracks is None:
+                return
+            del self._entries[key]
+            self._release(entry)
+
+    def _drop(self, key: str, entry: _Entry) -> None:
+        with self._lock:
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+
+    @staticmethod
+    def _release(entry: _Entry) -> None:
+        # Konto nur einmal freigeben, auch wenn ein Eintrag mehrfach abgeschlossen wird
+        if entry.held:
+            entry.held = False
+            entry.pool.release(entry.api_key)
+
+    def _expire(self) -> None:
+        now = time.time()
+        for key, entry in list(self._entries.items()):
+            if entry.finished_at is not None:
+                expired = now - entry.finished_at > self._ttl
+            else:
+                expired = now > entry.expires_at
+            if expired:
+                del self._entries[key]
+                self._release(entry)
+
+
+@lru_cache(maxsize=1)
+def default_submissions() -> SubmissionCache:
+    """Prozessweit geteilter Auftragscache für Oberfläche, Fan-out und Batch"""
+    return SubmissionCache()
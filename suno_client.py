@@ -0,0 +1,243 @@
+"""
+Suno API-Client für den KI Song-Agent
+Aufrufe gegen sunoapi.org ohne Streamlit-Abhängigkeit, damit sie auch aus
+Hintergrund-Threads heraus genutzt werden können
+"""
+
+import textwrap
+
+import requests
+
+from deadline import Deadline, bounded
+from health import CircuitBreaker
+
+BASE_URL     = "https://api.sunoapi.org"
+SUNO_MODEL   = "V4_5"
+CALLBACK_URL = "https://webhook.site/placeholder"
+POLL_DELAY   = 5                         # Sekunden
+SUBMIT_TIMEOUT   = 45                   # Sekunden pro Aufruf, höchstens bis zur Frist des Auftrags
+POLL_TIMEOUT     = 30
+CREDIT_TIMEOUT   = 30
+DOWNLOAD_TIMEOUT = 60
+STREAM_STATUSES = ("TEXT_SUCCESS", "FIRST_SUCCESS")   # Zwischenstände, ab denen Suno Stream-URLs liefert
+TRANSIENT_HTTP_STATUS = (429, 503)      # abgelehnt, bevor ein Auftrag entsteht
+TRANSIENT_API_CODES   = (430, 455)      # zu viele Anfragen, Wartungsmodus
+CREDITS_EXHAUSTED_CODE = 429            # Konto hat nicht genug Credits
+PROBE_TIMEOUT = 5                       # Sekunden für die Erreichbarkeitsprüfung
+
+# Gemeinsam für alle Konten: fällt sunoapi.org aus, scheitern weitere Aufrufe sofort
+SUNO_BREAKER = CircuitBreaker("Suno")
+
+def get_remaining_credits(api_key: str, deadline: Deadline | None = None) -> dict:
+    """Holt die verbleibenden Credits von sunoapi.org
+
+    Mit deadline höchstens bis zur Frist des Auftrags; solange Suno als gestört gilt, ohne Anfrage.
+    """
+    try:
+        timeout = bounded(CREDIT_TIMEOUT, deadline, "Credit-Abfrage")
+        SUNO_BREAKER.check()
+        headers = {"Authorization": f"Bearer {api_key}"}
+        try:
+            response = requests.get(f"{BASE_URL}/api/v1/generate/credit", headers=headers, timeout=timeout)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            _record_outcome(e, shortened=timeout < CREDIT_TIMEOUT)
+            raise
+        else:
+            _record_outcome()
+        finally:
+            SUNO_BREAKER.release_trial()
+
+        data = response.json()
+        if data.get("code") == 200:
+            # Die API gibt direkt die Credits als "data" zurück (integer)
+            credits = data.get("data", 0)
+            return {
+                "success": True,
+                "credits": credits,
+                "total_credits": None,  # Diese Info ist nicht verfügbar
+                "used_credits": None    # Diese Info ist nicht verfügbar
+            }
+        else:
+            return {"success": False, "error": data.get("msg", "Unbekannter Fehler")}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+def build_song_payload(genre: str, song_description: str, lyrics: str, style: str,
+                       instrumental: bool, model: str = SUNO_MODEL) -> dict:
+    """Payload für Suno API (immer Custom Mode, Modell laut Generierungsprofil)"""
+    return {
+        "model": model,
+        "customMode": True,
+        "instrumental": instrumental,
+        "style": style[:1000],
+        "prompt": lyrics[:5000],
+        "title": textwrap.shorten(f"{genre}: {song_description}", width=80, placeholder="…") or f"AI-Generated {genre} Song",
+        "callBackUrl": CALLBACK_URL
+    }
+
+class ApiError(RuntimeError):
+    """API-Fehler mit Einordnung für Wiederholungen
+
+    transient: Suno hat den Auftrag sicher nicht angenommen, ein neuer Versuch ist gefahrlos
+    ambiguous: die Anfrage kann angekommen sein, obwohl keine Antwort vorliegt
+    code: Fehlercode aus der API-Antwort, sofern vorhanden
+    """
+
+    def __init__(self, message: str, transient: bool = False, ambiguous: bool = False,
+                 code: int | None = None):
+        super().__init__(message)
+        self.transient = transient
+        self.ambiguous = ambiguous
+        self.code = code
+
+    @property
+    def credits_exhausted(self) -> bool:
+        return self.code == CREDITS_EXHAUSTED_CODE
+
+def _classify_request_error(e: requests.exceptions.RequestException) -> ApiError:
+    message = f"API‑/Netzwerkfehler: {e}"
+    if isinstance(e, requests.exceptions.HTTPError) and e.response is not None:
+        status = e.response.status_code
+        if status in TRANSIENT_HTTP_STATUS:
+            return ApiError(message, transient=True)
+        return ApiError(message, ambiguous=status >= 500)
+    # Ohne aufgebaute Verbindung kann die Anfrage Suno nicht erreicht haben
+    if isinstance(e, requests.exceptions.ConnectTimeout) or "NewConnectionError" in repr(e) \
+            or "NameResolutionError" in repr(e):
+        return ApiError(message, transient=True)
+    return ApiError(message, ambiguous=True)
+
+def _record_outcome(e: requests.exceptions.RequestException | None = None, shortened: bool = False) -> None:
+    """Meldet dem Breaker, ob sunoapi.org geantwortet hat; 4xx zählen als erreichbar
+
+    shortened: der Timeout war durch die Frist des Auftrags verkürzt und zählt dann nicht als Ausfall
+    """
+    if shortened and isinstance(e, requests.exceptions.Timeout):
+        return
+    if e is None or (isinstance(e, requests.exceptions.HTTPError) and e.response is not None
+                     and e.response.status_code < 500):
+        SUNO_BREAKER.record_success()
+    else:
+        SUNO_BREAKER.record_failure(e)
+
+def ping_suno(api_key: str) -> None:
+    """Erreichbarkeitsprüfung für den HealthMonitor; RuntimeError, wenn sunoapi.org nicht antwortet"""
+    headers = {"Authorization": f"Bearer {api_key}"}
+    try:
+        r = requests.get(f"{BASE_URL}/api/v1/generate/credit", headers=headers, timeout=PROBE_TIMEOUT)
+    except requests.exceptions.RequestException as e:
+        raise RuntimeError(f"API‑/Netzwerkfehler: {e}")
+    if r.status_code >= 500:
+        raise RuntimeError(f"API‑/Netzwerkfehler: HTTP {r.status_code}")
+
+def post_api_request(path: str, payload: dict, api_key: str, deadline: Deadline | None = None) -> dict:
+    timeout = bounded(SUBMIT_TIMEOUT, deadline, "Einreichen")
+    if not SUNO_BREAKER.allow():
+        # Nicht gesendet, aber auch nicht wiederholen: der Ausfall dauert länger als der Backoff
+        raise ApiError(f"Suno ist derzeit nicht erreichbar: {SUNO_BREAKER.last_error}")
+    headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+    try:
+        r = requests.post(f"{BASE_URL}{path}", json=payload, headers=headers, timeout=timeout)
+        r.raise_for_status()
+        res = r.json()
+    except requests.exceptions.RequestException as e:
+        _record_outcome(e, shortened=timeout < SUBMIT_TIMEOUT)
+        raise _classify_request_error(e)
+    except ValueError as e:
+        _record_outcome()
+        raise ApiError(f"Ungültige API‑Antwort: {e}", ambiguous=True)
+    else:
+        _record_outcome()
+    finally:
+        # Ein Testaufruf ohne gezähltes Ergebnis (z.B. durch die Frist verkürzt) darf den Breaker nicht sperren
+        SUNO_BREAKER.release_trial()
+    if isinstance(res, dict) and res.get("code") not in (200, 201, None):
+        raise ApiError(res.get("msg", "Unbekannter API‑Fehler"),
+                       transient=res.get("code") in TRANSIENT_API_CODES, code=res.get("code"))
+    return res
+
+def extract_task_id(resp: dict) -> str | None:
+    candidates = ("taskId", "task_id", "id", "task_uuid")
+    data = resp.get("data", {})
+    if isinstance(data, dict):
+        for k in candidates:
+            if data.get(k):
+                return str(data[k])
+    if isinstance(data, list) and data and isinstance(data[0], dict):
+        for k in candidates:
+            if data[0].get(k):
+                return str(data[0][k])
+    for k in candidates:
+        if resp.get(k):
+            return str(resp[k])
+    return None
+
+def get_task_info(task_id: str, api_key: str, deadline: Deadline | None = None) -> dict:
+    """Status eines Auftrags; CircuitOpen, solange Suno als gestört gilt"""
+    timeout = bounded(POLL_TIMEOUT, deadline, "Statusabfrage")
+    SUNO_BREAKER.check()
+    headers = {"Authorization": f"Bearer {api_key}"}
+    params  = {"taskId": task_id.strip()}
+    try:
+        r = requests.get(f"{BASE_URL}/api/v1/generate/record-info",
+                         headers=headers, params=params, timeout=timeout)
+        r.raise_for_status()
+        info = r.json()
+    except requests.exceptions.RequestException as e:
+        _record_outcome(e, shortened=timeout < POLL_TIMEOUT)
+        raise RuntimeError(f"API‑/Netzwerkfehler: {e}")
+    except ValueError as e:
+        _record_outcome()
+        raise RuntimeError(f"API‑/Netzwerkfehler: {e}")
+    else:
+        _record_outcome()
+    finally:
+        SUNO_BREAKER.release_trial()
+    return info
+
+def is_generation_complete(info: dict) -> tuple[bool, bool, list]:
+    data   = info.get("data") or {}       # Suno liefert teils "data": null
+    status = (data.get("status") or "").upper()
+
+    if status.endswith("FAILED") or status in ("EXPIRED",
+            "CREATE_TASK_FAILED", "GENERATE_AUDIO_FAILED"):
+        return True, True, []
+
+    if status != "SUCCESS":
+        return False, False, []
+
+    tracks = (data.get("response") or {}).get("sunoData") or []
+    return True, False, tracks
+
+def track_audio_url(track: dict) -> str | None:
+    """Liefert die Audio-URL eines Suno-Tracks"""
+    return track.get("audioUrl") or track.get("audio_url")
+
+def track_stream_url(track: dict) -> str | None:
+    """Liefert die Stream-URL eines Suno-Tracks, die schon vor dem Mastering abspielbar ist"""
+    return track.get("streamAudioUrl") or track.get("stream_audio_url")
+
+def early_stream_url(info: dict) -> str | None:
+    """Erste abspielbare URL eines noch laufenden Auftrags: fertiger Clip vor Stream"""
+    data   = info.get("data") or {}
+    status = (data.get("status") or "").upper()
+    if status not in STREAM_STATUSES:
+        return None
+    tracks = (data.get("response") or {}).get("sunoData") or []
+    for track in tracks:
+        if track_audio_url(track):
+            return track_audio_url(track)
+    for track in tracks:
+        if track_stream_url(track):
+            return track_stream_url(track)
+    return None
+
+def download_audio(url: str, deadline: Deadline | None = None) -> bytes:
+    timeout = bounded(DOWNLOAD_TIMEOUT, deadline, "Download")
+    try:
+        r = requests.get(url, timeout=timeout)
+        r.raise_for_status()
+        return r.content
+    except requests.exceptions.RequestException as e:
+        raise RuntimeError(f"API‑/Netzwerkfehler: {e}")
@@ -0,0 +1,110 @@
+"""
+Stylesheet-Bundle für den KI Song-Agent
+Fasst die CSS-Dateien aus assets/css zu einem minimierten Stylesheet mit
+Inhalts-Hash im Dateinamen zusammen. Bei aktiviertem Static Serving
+(server.enableStaticServing) wird es unter app/static/ ausgeliefert und pro
+Rerun nur noch per @import referenziert; der Browser cached die Datei.
+Ältere Streamlit-Versionen liefern .css aus app/static als text/plain mit
+nosniff aus, was Browser als Stylesheet verweigern – dort wird das Bundle
+weiterhin inline eingebunden. Liegen
+Inter-Schriftdateien in static/fonts, werden sie selbst gehostet; sonst wird
+Inter wie bisher von Google Fonts geladen.
+"""
+
+import glob
+import hashlib
+import importlib
+import os
+import re
+from functools import lru_cache
+
+BASE_DIR    = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIR  = os.path.join(BASE_DIR, "assets", "css")
+STATIC_DIR  = os.path.join(BASE_DIR, "static")
+FONTS_DIR   = os.path.join(STATIC_DIR, "fonts")
+STATIC_URL  = "app/static"
+STYLESHEETS = ("app.css", "components.css", "creation.css")
+FONTS_URL   = "https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap"
+FONT_FILES  = {                          # Schriftstärke → Dateiname in static/fonts
+    300: "Inter-Light.woff2",
+    400: "Inter-Regular.woff2",
+    500: "Inter-Medium.woff2",
+    600: "Inter-SemiBold.woff2",
+    700: "Inter-Bold.woff2"
+}
+
+_COMMENTS    = re.compile(r"/\*.*?\*/", re.S)
+_WHITESPACE  = re.compile(r"\s+")
+_PUNCTUATION = re.compile(r"\s*([{};,>])\s*")
+_COLON       = re.compile(r":\s+")
+
+
+def minify_css(css: str) -> str:
+    """Entfernt Kommentare und überflüssige Leerzeichen"""
+    css = _COMMENTS.sub("", css)
+    css = _WHITESPACE.sub(" ", css)
+    css = _PUNCTUATION.sub(r"\1", css)
+    css = _COLON.sub(":", css)
+    return css.replace(";}", "}").strip()
+
+def font_face_rules(self_hosted: bool = True) -> str:
+    """@font-face-Regeln für vorhandene Schriftdateien (Pfade relativ zum Stylesheet)
+
+    Ohne Schriftdateien oder ohne self_hosted (inline, ohne app/static) wird Inter von Google Fonts importiert.
+    """
+    rules = []
+    for weight, filename in FONT_FILES.items():
+        if self_hosted and os.path.exists(os.path.join(FONTS_DIR, filename)):
+            rules.append(
+                "@font-face{font-family:'Inter';font-style:normal;font-display:swap;"
+                f"font-weight:{weight};src:local('Inter'),url(fonts/{filename}) format('woff2')}}"
+            )
+    return "".join(rules) or f"@import url('{FONTS_URL}');"
+
+def build_css(self_hosted_fonts: bool = True) -> str:
+    """Liest alle Quelldateien und liefert das minimierte Bundle; @import bzw. @font-face stehen vorn"""
+    parts = [font_face_rules(self_hosted_fonts)]
+    for name in STYLESHEETS:
+        with open(os.path.join(ASSETS_DIR, name), 'r', encoding='utf-8') as f:
+            parts.append(minify_css(f.read()))
+    return "".join(parts)
+
+def publish_stylesheet() -> str:
+    """Schreibt das Bundle als static/app.<hash>.css und liefert dessen URL"""
+    css = build_css()
+    digest = hashlib.sha1(css.encode("utf-8")).hexdigest()[:10]
+    filename = f"app.{digest}.css"
+    path = os.path.join(STATIC_DIR, filename)
+    if not os.path.exists(path):
+        os.makedirs(STATIC_DIR, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(css)
+        os.replace(tmp_path, path)
+    # Ältere Versionen aufräumen
+    for stale in glob.glob(os.path.join(STATIC_DIR, "app.*.css")):
+        if os.path.basename(stale) != filename:
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
+    return f"{STATIC_URL}/{filename}"
+
+@lru_cache(maxsize=1)
+def static_css_supported() -> bool:
+    """True, wenn Streamlit .css unter app/static mit dem Typ text/css ausliefert
+
+    Der Tornado-Handler älterer Versionen kennt nur eine feste Liste von Endungen ohne .css;
+    neuere Versionen bestimmen den Typ über mimetypes und haben diesen Handler nicht mehr.
+    """
+    try:
+        handler = importlib.import_module("streamlit.web.server.app_static_file_handler")
+    except ImportError:
+        return True
+    return ".css" in getattr(handler, "SAFE_APP_STATIC_FILE_EXTENSIONS", ())
+
+def stylesheet_markup(static_serving: bool) -> str:
+    """HTML, das pro Rerun eingebunden wird: ein @import oder, ohne nutzbares Static Serving, das Bundle inline"""
+    if static_serving and static_css_supported():
+        return f"<style>@import url('{publish_stylesheet()}');</style>"
+    return f"<style>{build_css(self_hosted_fonts=False)}</style>"